@@ -1,4 +1,3 @@
-import math
 import struct
 from argparse import ArgumentParser, Namespace
 
@@ -18,6 +17,7 @@ __all__ = [
     "OFFSET_DISPLAY_OFF",
     "OFFSET_SCROLL",
     "OFFSET_CHAR",
+    "INIT_END",
 ]
 
 
@@ -116,6 +116,7 @@ rom_offset = SEQ_COUNT * 2 * 2
 
 rom = []
 index = b""
+seq_ends = []
 for parts in seqs:
     index += struct.pack("<HH", rom_offset + len(rom), len(parts[0]))
     for i, part in enumerate(parts):
@@ -126,11 +127,16 @@ for parts in seqs:
             nextlen = len(parts[i + 1])
             assert nextlen > 0
             rom.extend(struct.pack("<H", nextlen))
+    seq_ends.append(rom_offset + len(rom))
 
 ROM_CONTENT = index + bytes(rom)
 
+# Everything INIT reads lies before this offset, so it can run before the rest
+# of the ROM is loaded.
+INIT_END = seq_ends[OFFSET_INIT]
+
 ROM_LENGTH = len(ROM_CONTENT)
-ROM_ABITS = math.ceil(math.log2(ROM_LENGTH))
+ROM_ABITS = (ROM_LENGTH - 1).bit_length()
 
 # ROM structure:
 # "Commands" are 1 or more sequences of bytes to send as individual I2C transmissions.
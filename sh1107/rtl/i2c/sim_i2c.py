@@ -187,14 +187,16 @@ def send(
         if bit == 0:
             if isinstance(next, int):
                 assert (yield i2c.bus.in_fifo_r_rdy)
+                # Check what's queued, not w_data: writers may only hold
+                # w_data for the cycle they strobe w_en.
                 assert (
-                    yield i2c.bus.in_fifo_w_data
-                ) == next, f"checking next: expected {next:02x}, got {(yield i2c.bus.in_fifo_w_data):02x}"
+                    yield i2c._in_fifo.r_data
+                ) == next, f"checking next: expected {next:02x}, got {(yield i2c._in_fifo.r_data):02x}"
                 assert not (yield i2c.bus.in_fifo_w_en)
             elif next == "STOP":
                 assert not (
                     yield i2c.bus.in_fifo_r_rdy
-                ), f"checking next: expected empty FIFO, contained ({(yield i2c.bus.in_fifo_w_data):02x})"
+                ), f"checking next: expected empty FIFO, contained ({(yield i2c._in_fifo.r_data):02x})"
 
     assert actual == byte, f"expected {byte:02x}, got {actual:02x}"
 
@@ -273,7 +275,7 @@ def steady_stopped(i2c: I2C, *, wait_steps: int = 5) -> sim.Procedure:
 
     assert not (
         yield i2c.bus.in_fifo_r_rdy
-    ), f"unexpected data waiting on I2C in fifo: {(yield i2c.bus.in_fifo_w_data):02x}"
+    ), f"unexpected data waiting on I2C in fifo: {(yield i2c._in_fifo.r_data):02x}"
     assert not (yield i2c.bus.busy)
 
 
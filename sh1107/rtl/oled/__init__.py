@@ -1,11 +1,15 @@
 import math
+import operator
+from functools import reduce
 from typing import Final
 
-from amaranth import (C, Cat, ClockSignal, Elaboratable, Instance, Memory,
-                      Module, Mux, Signal)
+from amaranth import (Array, C, Cat, ClockSignal, Elaboratable, Instance,
+                      Memory, Module, Mux, Signal, Value)
+from amaranth.hdl.ast import Statement
 from amaranth.lib.enum import IntEnum
 from amaranth.lib.fifo import SyncFIFO
-from amaranth.lib.wiring import Component, In, Out, connect, flipped
+from amaranth.lib.wiring import (Component, FlippedInterface, In, Out,
+                                  PureInterface, Signature, connect, flipped)
 
 from ... import rom
 from ...base import Blackbox
@@ -21,6 +25,14 @@ from .scroller import Scroller
 
 __all__ = ["OLED"]
 
+# Our platform memories are all 16 bits wide, so the ROM is packed 2 bytes to a
+# word.  See OLED.elaborate_memory.
+ROM_WORDS: Final[int] = math.ceil(rom.ROM_LENGTH / 2)
+ROM_WORD_ABITS: Final[int] = (ROM_WORDS - 1).bit_length()
+
+# Contents of the hex digit ROM; see OLED.hex_lookup.
+HEX_DIGITS: Final[bytes] = b"0123456789ABCDEF"
+
 
 class OLED(Component):
     ADDR: Final[int] = 0x3C
@@ -36,6 +48,11 @@ class OLED(Component):
     # I tried adding some delays after switching to command mode (i.e. add some
     # extra commands!) before restarting the transaction in read, but it still
     # ended up giving me display RAM data back.  This doesn't happen at 400kHz.
+    #
+    # Stretching only the START/STOP/RESTART phases isn't enough to fix this
+    # up: the repeated START and STOP edges land a quarter of an SCL period
+    # after SCL rises (0.25μs at 1MHz), and the SH1107's 400kHz ceiling is on
+    # SCL itself.  1MHz stays out until it's been shown to work on hardware.
     VALID_BUILD_SPEEDS: Final[list[int]] = [
         100_000,
         400_000,
@@ -60,14 +77,25 @@ class OLED(Component):
         PRINT_BYTE = 0x0A
         SPI_TEST = 0x0B
 
+    # Commands are decoded one-hot, indexed by value; see START.
+    assert [c.value for c in Command] == list(range(len(Command)))
+
     class Result(IntEnum, shape=2):
         SUCCESS = 0
         BUSY = 1
         FAILURE = 2
 
+    class BusOwner(IntEnum, shape=3):
+        OWN = 0
+        ROM_WRITER = 1
+        LOCATOR = 2
+        CLSER = 3
+        SCROLLER = 4
+
     _addr: int
     _cursor_rate: float  # Seconds before toggling.
     _cursor_char: str
+    _spi_test: bool
 
     i2c_bus: Out(I2CBus)
     own_i2c_bus: Out(I2CBus)
@@ -77,13 +105,15 @@ class OLED(Component):
     _i_i2c_bb_in_out_fifo_data: Signal
     _i_i2c_bb_in_out_fifo_stb: Signal
 
-    spifr_bus: Out(SPIFlashReaderBus)
+    spifr_bus: Out(SPIFlashReaderBus(16))
     _spifr: SPIFlashReader | Instance
 
     _rom_wr_en: Signal
     _rom_wr_data: Signal
+    _rom_wr_addr: Signal
+    _rom_loaded: Signal
+    _rom_init_ready: Signal
     rom_bus: Out(ROMBus(rom.ROM_ABITS, 8))
-    own_rom_bus: Out(ROMBus(rom.ROM_ABITS, 8))
     _rom_mem: Instance | Memory
 
     _rom_writer: ROMWriter
@@ -91,6 +121,7 @@ class OLED(Component):
     _clser: Clser
     _scroller: Scroller
     _cursor_c: Counter
+    _bus_owner: Signal
 
     _fifo_in: SyncFIFO
     result: In(Result, init=Result.BUSY)
@@ -102,19 +133,31 @@ class OLED(Component):
     _cursor_last_drawn_row: Signal
     _cursor_last_drawn_col: Signal
 
+    _hex_nibble: Signal
+    _hex_char: Signal
+    _hex_low_nibble: Signal
+    _hex_spi_test: Signal
+
     _chpr_data: Signal
+    _chpr_index: Signal
     _chpr_advance: Signal
     _chpr_run: Signal
+    _chpr_done: Signal
 
     def __init__(
         self,
         *,
         platform: Platform,
         speed: Hz,
+        fifo_in_depth: int = 8,
+        spi_test: bool = True,
     ):
         self._addr = OLED.ADDR
         self._cursor_rate = 0.5
         self._cursor_char = "_"
+        # SPI_TEST is a debugging aid; builds without it save its FIFO and
+        # states, and fail the command.
+        self._spi_test = spi_test
 
         super().__init__()
 
@@ -144,7 +187,7 @@ class OLED(Component):
             )
 
         if Blackbox.SPIFR not in platform.blackboxes:
-            self._spifr = SPIFlashReader()
+            self._spifr = SPIFlashReader(data_width=16)
         else:
             self._spifr = Instance(
                 "spifr",
@@ -158,14 +201,18 @@ class OLED(Component):
             )
 
         self._rom_wr_en = Signal()
-        self._rom_wr_data = Signal(8)
+        self._rom_wr_data = Signal(16)
+        self._rom_wr_addr = Signal(range(ROM_WORDS + 1))
+        self._rom_loaded = Signal()
+        self._rom_init_ready = Signal()
         self._rom_writer = ROMWriter(addr=self._addr)
         self._locator = Locator(addr=self._addr)
         self._clser = Clser(addr=self._addr)
         self._scroller = Scroller(addr=self._addr)
         self._cursor_c = Counter(time=self._cursor_rate)
+        self._bus_owner = Signal(OLED.BusOwner)
 
-        self.fifo_in = SyncFIFO(width=8, depth=1)
+        self.fifo_in = SyncFIFO(width=8, depth=fifo_in_depth)
 
         self._row = Signal(range(1, 17), init=1)
         self._col = Signal(range(1, 17), init=1)
@@ -174,9 +221,16 @@ class OLED(Component):
         self._cursor_last_drawn_row = Signal(range(0, 17), init=1)
         self._cursor_last_drawn_col = Signal(range(0, 17), init=1)
 
+        self._hex_nibble = Signal(4)
+        self._hex_char = Signal(8)
+        self._hex_low_nibble = Signal(4)
+        self._hex_spi_test = Signal()
+
         self._chpr_data = Signal(8)
+        self._chpr_index = Signal(range(rom.SEQ_COUNT))
         self._chpr_advance = Signal(init=1)
         self._chpr_run = Signal()
+        self._chpr_done = Signal()
 
     def elaborate(self, platform: Platform) -> Elaboratable:
         m = Module()
@@ -184,61 +238,41 @@ class OLED(Component):
         self.elaborate_memory(m, platform)
         self.elaborate_submodules(m, platform)
 
-        m.d.comb += self._cursor_c.en.eq(self._cursor_en)
-
-        command = Signal(8)
-
-        with m.FSM():
-            with m.State("INIT: BEGIN"):
-                m.d.sync += [
-                    self.own_rom_bus.addr.eq(0),
-                    self.spifr_bus.addr.eq(platform.flash_rom_base),
-                    self.spifr_bus.len.eq(rom.ROM_LENGTH),
-                    self.spifr_bus.stb.eq(1),
-                ]
-                m.next = "INIT: STROBED SPIFR"
+        # Decoded one-hot as it's read, so "START" tests one bit per command
+        # instead of comparing against each.  Unknown commands decode to
+        # nothing, and hang there as they always have.
+        command = Signal(len(OLED.Command))
 
-            with m.State("INIT: STROBED SPIFR"):
-                m.d.sync += self.spifr_bus.stb.eq(0)
-                m.next = "INIT: WAIT SPIFR"
-
-            with m.State("INIT: WAIT SPIFR"):
-                with m.If(self.spifr_bus.valid):
-                    m.d.sync += [
-                        self._rom_wr_data.eq(self.spifr_bus.data),
-                        self._rom_wr_en.eq(1),
-                    ]
-                    m.next = "INIT: STROBED ROM_WR"
-                with m.Elif(~self.spifr_bus.busy):
+        with m.FSM() as fsm:
+            with m.State("INIT: WAIT ROM"):
+                # The ROM loads in the background (see rom_load_fsm); INIT can
+                # go as soon as the memory says it can be read.
+                with m.If(self._rom_init_ready):
                     m.d.sync += self.result.eq(OLED.Result.SUCCESS)
                     m.next = "IDLE"
 
-            with m.State("INIT: STROBED ROM_WR"):
-                m.d.sync += [
-                    self._rom_wr_en.eq(0),
-                    self.own_rom_bus.addr.eq(
-                        Mux(
-                            self.own_rom_bus.addr == rom.ROM_LENGTH - 1,
-                            0,
-                            self.own_rom_bus.addr + 1,
-                        )
-                    ),
-                ]
-                m.next = "INIT: WAIT SPIFR"
-
             with m.State("IDLE"):
                 with m.If(self._cursor_c.full):
                     with m.If(self._cursor_state):
                         m.next = "CURSOR_OFF: RESET"
                     with m.Else():
                         m.next = "CURSOR_ON: RESET"
-                with m.Elif(self.fifo_in.r_rdy & self.own_i2c_bus.in_fifo_w_rdy):
+                with m.Elif(
+                    self.fifo_in.r_rdy
+                    & self.own_i2c_bus.in_fifo_w_rdy
+                    & (
+                        self._rom_loaded
+                        | (self.fifo_in.r_data == OLED.Command.INIT)
+                    )
+                ):
                     m.d.sync += [
-                        command.eq(self.fifo_in.r_data),
-                        self.fifo_in.r_en.eq(1),
+                        command.eq(
+                            Cat(self.fifo_in.r_data == c for c in OLED.Command)
+                        ),
                         self.result.eq(OLED.Result.BUSY),
                     ]
-                    m.next = "START: STROBED FIFO_IN R_EN"
+                    m.d.comb += self.fifo_in.r_en.eq(1)
+                    m.next = "START"
                 with m.Elif(
                     self._cursor_en
                     & (
@@ -249,85 +283,93 @@ class OLED(Component):
                     m.d.sync += self._cursor_en.eq(0)
                     m.next = "CURSOR_ON: RESET"
 
-            with m.State("START: STROBED FIFO_IN R_EN"):
-                m.d.sync += self.fifo_in.r_en.eq(0)
-                with m.Switch(command):
-                    with m.Case(OLED.Command.NOP):
-                        m.d.sync += self.result.eq(OLED.Result.SUCCESS)
-                        m.next = "IDLE"
+            with m.State("START"):
+                with m.If(command[OLED.Command.NOP]):
+                    m.d.sync += self.result.eq(OLED.Result.SUCCESS)
+                    m.next = "IDLE"
 
-                    with m.Case(OLED.Command.INIT):
-                        m.d.sync += [
-                            self._rom_writer.index.eq(rom.OFFSET_INIT),
-                            self._rom_writer.stb.eq(1),
-                            self._row.eq(1),
-                            self._col.eq(1),
-                            self._scroller.rst.eq(1),
-                        ]
-                        m.next = "INIT: STROBED ROM WRITER"
+                # Submodule strobes are combinatorial throughout: each
+                # submodule acts on stb the cycle it's raised, and is busy from
+                # the next, so there's no cycle spent lowering it again.
+                with m.If(command[OLED.Command.INIT]):
+                    m.d.comb += [
+                        self._rom_writer.index.eq(rom.OFFSET_INIT),
+                        self._rom_writer.stb.eq(1),
+                        self._scroller.rst.eq(1),
+                    ]
+                    m.d.sync += [
+                        self._row.eq(1),
+                        self._col.eq(1),
+                    ]
+                    m.next = "ROM WRITE SINGLE: UNSTROBED ROM WRITER"
 
-                    with m.Case(OLED.Command.DISPLAY_ON):
-                        m.d.sync += [
-                            self._rom_writer.index.eq(rom.OFFSET_DISPLAY_ON),
-                            self._rom_writer.stb.eq(1),
-                        ]
-                        m.next = "ROM WRITE SINGLE: STROBED ROM WRITER"
+                with m.If(command[OLED.Command.DISPLAY_ON]):
+                    m.d.comb += [
+                        self._rom_writer.index.eq(rom.OFFSET_DISPLAY_ON),
+                        self._rom_writer.stb.eq(1),
+                    ]
+                    m.next = "ROM WRITE SINGLE: UNSTROBED ROM WRITER"
 
-                    with m.Case(OLED.Command.DISPLAY_OFF):
-                        m.d.sync += [
-                            self._rom_writer.index.eq(rom.OFFSET_DISPLAY_OFF),
-                            self._rom_writer.stb.eq(1),
-                        ]
-                        m.next = "ROM WRITE SINGLE: STROBED ROM WRITER"
+                with m.If(command[OLED.Command.DISPLAY_OFF]):
+                    m.d.comb += [
+                        self._rom_writer.index.eq(rom.OFFSET_DISPLAY_OFF),
+                        self._rom_writer.stb.eq(1),
+                    ]
+                    m.next = "ROM WRITE SINGLE: UNSTROBED ROM WRITER"
 
-                    with m.Case(OLED.Command.CLS):
-                        m.d.sync += [
-                            self._clser.stb.eq(1),
-                            self._row.eq(1),
-                            self._col.eq(1),
-                        ]
-                        m.next = "CLSER: STROBED"
+                with m.If(command[OLED.Command.CLS]):
+                    m.d.comb += self._clser.stb.eq(1)
+                    m.d.sync += [
+                        self._row.eq(1),
+                        self._col.eq(1),
+                    ]
+                    m.next = "CLSER: UNSTROBED"
 
-                    with m.Case(OLED.Command.LOCATE):
-                        m.next = "LOCATE: ROW: WAIT"
+                with m.If(command[OLED.Command.LOCATE]):
+                    m.next = "LOCATE: ROW: WAIT"
 
-                    with m.Case(OLED.Command.PRINT):
-                        m.next = "PRINT: COUNT: WAIT"
+                with m.If(command[OLED.Command.PRINT]):
+                    m.next = "PRINT: COUNT: WAIT"
 
-                    with m.Case(OLED.Command.CURSOR_ON):
-                        m.d.sync += [
-                            self._cursor_en.eq(0),
-                            self.result.eq(OLED.Result.SUCCESS),
-                        ]
-                        m.next = "CURSOR_ON: RESET"
+                with m.If(command[OLED.Command.CURSOR_ON]):
+                    m.d.sync += [
+                        self._cursor_en.eq(0),
+                        self.result.eq(OLED.Result.SUCCESS),
+                    ]
+                    m.next = "CURSOR_ON: RESET"
 
-                    with m.Case(OLED.Command.CURSOR_OFF):
-                        m.d.sync += [
-                            self._cursor_en.eq(0),
-                            self.result.eq(OLED.Result.SUCCESS),
-                        ]
-                        m.next = "CURSOR_OFF: RESET"
+                with m.If(command[OLED.Command.CURSOR_OFF]):
+                    m.d.sync += [
+                        self._cursor_en.eq(0),
+                        self.result.eq(OLED.Result.SUCCESS),
+                    ]
+                    m.next = "CURSOR_OFF: RESET"
 
-                    with m.Case(OLED.Command.ID):
-                        m.next = "ID: START"
+                with m.If(command[OLED.Command.ID]):
+                    m.next = "ID: START"
 
-                    with m.Case(OLED.Command.PRINT_BYTE):
-                        m.next = "PRINT_BYTE: START"
+                with m.If(command[OLED.Command.PRINT_BYTE]):
+                    m.next = "PRINT_BYTE: START"
 
-                    with m.Case(OLED.Command.SPI_TEST):
+                with m.If(command[OLED.Command.SPI_TEST]):
+                    if self._spi_test:
                         m.next = "SPI_TEST: START"
+                    else:
+                        m.d.sync += self.result.eq(OLED.Result.FAILURE)
+                        m.next = "IDLE"
 
             self.locate_states(m)
             self.print_states(m)
             self.id_states(m)
             self.print_byte_states(m)
-            self.spi_test_states(m, platform)
+            self.hex_states(m)
+            if self._spi_test:
+                self.spi_test_states(m, platform)
 
             with m.State("CURSOR_ON: RESET"):
                 m.d.sync += [
-                    self._chpr_data.eq(ord(self._cursor_char)),
+                    *self.chpr_start(ord(self._cursor_char)),
                     self._chpr_advance.eq(0),
-                    self._chpr_run.eq(1),
                     self._cursor_en.eq(1),
                     self._cursor_state.eq(1),
                     self._cursor_last_drawn_row.eq(self._row),
@@ -337,93 +379,105 @@ class OLED(Component):
 
             with m.State("CURSOR_OFF: RESET"):
                 m.d.sync += [
-                    self._chpr_data.eq(ord(" ")),
+                    *self.chpr_start(ord(" ")),
                     self._chpr_advance.eq(0),
-                    self._chpr_run.eq(1),
                     self._cursor_state.eq(0),
                 ]
                 m.next = "CURSOR_ON/OFF: CHPR RUNNING"
 
             with m.State("CURSOR_ON/OFF: CHPR RUNNING"):
-                with m.If(~self._chpr_run):
+                with m.If(self._chpr_done):
                     m.next = "IDLE"
 
-            with m.State("CLSER: STROBED"):
-                m.d.sync += self._clser.stb.eq(0)
-                m.next = "CLSER: UNSTROBED"
-
             with m.State("CLSER: UNSTROBED"):
                 with m.If(~self._clser.busy):
+                    # The Locator only looks at row and col after it's started.
                     m.d.sync += [
                         self._locator.row.eq(self._row),
                         self._locator.col.eq(self._col),
-                        self._locator.stb.eq(1),
                     ]
-                    m.next = "CLSER: STROBED LOCATOR"
-
-            with m.State("CLSER: STROBED LOCATOR"):
-                m.d.sync += self._locator.stb.eq(0)
-                m.next = "CLSER: UNSTROBED LOCATOR"
+                    m.d.comb += self._locator.stb.eq(1)
+                    m.next = "CLSER: UNSTROBED LOCATOR"
 
             with m.State("CLSER: UNSTROBED LOCATOR"):
                 with m.If(~self._locator.busy):
                     m.d.sync += self.result.eq(OLED.Result.SUCCESS)
                     m.next = "IDLE"
 
-            with m.State("INIT: STROBED ROM WRITER"):
-                m.d.sync += [
-                    self._rom_writer.stb.eq(0),
-                    self._scroller.rst.eq(0),
-                ]
-                m.next = "ROM WRITE SINGLE: UNSTROBED ROM WRITER"
-
-            with m.State("ROM WRITE SINGLE: STROBED ROM WRITER"):
-                m.d.sync += self._rom_writer.stb.eq(0)
-                m.next = "ROM WRITE SINGLE: UNSTROBED ROM WRITER"
-
             with m.State("ROM WRITE SINGLE: UNSTROBED ROM WRITER"):
                 with m.If(~self._rom_writer.busy):
                     m.d.sync += self.result.eq(OLED.Result.SUCCESS)
                     m.next = "IDLE"
 
+        # With this many states, binary encoding puts a deep decoder in front of
+        # every output; ask Yosys for one-hot explicitly rather than relying on
+        # fsm_recode's heuristics.
+        fsm.state.attrs["fsm_encoding"] = "one-hot"
+
+        # Only IDLE can act on the blink, so don't run the counter otherwise.
+        # This restarts the blink after each command.
+        m.d.comb += self._cursor_c.en.eq(self._cursor_en & fsm.ongoing("IDLE"))
+
+        # Hex digits come out of a small ROM rather than a compare, two adders
+        # and a mux.  (The branchless nibble + 0x30 + 7 * carry(nibble + 6)
+        # is still two carry chains.)  Its read port is registered, so the
+        # digit arrives the cycle after its nibble is looked up.
+        hex_rom = Memory(width=8, depth=len(HEX_DIGITS), init=HEX_DIGITS)
+        m.submodules.hex_rom_rd = hex_rom_rd = hex_rom.read_port(
+            transparent=False
+        )
+        m.d.comb += [
+            hex_rom_rd.addr.eq(self._hex_nibble),
+            self._hex_char.eq(hex_rom_rd.data),
+        ]
+
         self.chpr_fsm(m)
+        self.rom_load_fsm(m, platform)
 
         return m
 
     def elaborate_memory(self, m: Module, platform: Platform):
-        # Our platform memories are all 16 bits wide, so pack 2 bytes of ROM
-        # data into each word.
-        #
         # Transparently expose an 8-bit ROM bus by translating addresses and
-        # slicing the data.
-
-        packed_size = math.ceil(rom.ROM_LENGTH / 2)
+        # slicing the data.  Writes only happen while loading the ROM from
+        # flash, which delivers whole words.  Where the memory has a separate
+        # write port, reads can carry on during the load; _rom_init_ready says
+        # when INIT may start reading.
 
-        addr = Signal(math.ceil(math.log2(packed_size)))
+        addr = Signal(ROM_WORD_ABITS)
         rd_data = Signal(16)
-        wr_en = Signal(2)
 
         # Decisions about which part of the word to use need to be based on the
         # issuing cycle's address.
         effective_addr = Signal.like(self.rom_bus.addr)
         m.d.sync += effective_addr.eq(self.rom_bus.addr)
 
-        m.d.comb += [
-            addr.eq(self.rom_bus.addr >> 1),
-            self.rom_bus.data.eq(rd_data.word_select(effective_addr[0], 8)),
-            wr_en.eq(
-                self._rom_wr_en.replicate(2)
-                & Mux(effective_addr[0], C(0b10, 2), C(0b01, 2))
-            ),
-        ]
+        # Register the selected byte so consumers start their cycle from a flop
+        # rather than memory output plus mux.  ROMBus accounts for the extra
+        # cycle of latency.
+        m.d.comb += addr.eq(self.rom_bus.addr >> 1)
+        m.d.sync += self.rom_bus.data.eq(rd_data.word_select(effective_addr[0], 8))
 
         match platform:
             case icebreaker():
+                # SPRAM is a single port: reads and writes share one address,
+                # and Yosys can't map a $mem with separate ones onto it.  The
+                # load owns the address until it's done, so INIT waits for the
+                # whole ROM here, as every other command already does in IDLE.
+                #
+                # This stays a raw $mem rather than a Memory for two reasons:
+                # SPRAM can't be initialised, and a Memory always emits a
+                # (zero) INIT, which keeps Yosys from choosing SPRAM; and a
+                # Memory's read and write ports each carry their own address.
+                shared_addr = Signal.like(addr)
+                m.d.comb += [
+                    shared_addr.eq(Mux(self._rom_loaded, addr, self._rom_wr_addr)),
+                    self._rom_init_ready.eq(self._rom_loaded),
+                ]
                 self._rom_mem = Instance(
                     "$mem",
                     a_ram_style="huge",
                     p_MEMID="\\rom_mem",
-                    p_SIZE=packed_size,
+                    p_SIZE=ROM_WORDS,
                     p_ABITS=len(addr),
                     p_WIDTH=16,
                     p_INIT=C(0, 0),
@@ -437,12 +491,12 @@ class OLED(Component):
                     p_WR_CLK_POLARITY=C(1, 1),
                     i_RD_CLK=ClockSignal(),
                     i_RD_EN=1,
-                    i_RD_ADDR=addr,
+                    i_RD_ADDR=shared_addr,
                     o_RD_DATA=rd_data,
                     i_WR_CLK=ClockSignal(),
-                    i_WR_EN=Cat(wr_en[0].replicate(8), wr_en[1].replicate(8)),
-                    i_WR_ADDR=addr,
-                    i_WR_DATA=self._rom_wr_data.replicate(2),
+                    i_WR_EN=self._rom_wr_en.replicate(16),
+                    i_WR_ADDR=shared_addr,
+                    i_WR_DATA=self._rom_wr_data,
                 )
                 m.submodules.rom_mem = self._rom_mem
             case _:
@@ -450,15 +504,19 @@ class OLED(Component):
                 # As is typical, zero-init ends up making the bitstream slightly
                 # larger than if we'd put actual data in it, so this is very
                 # much for Fun(tm).
-                self._rom_mem = Memory(width=16, depth=packed_size)
+                self._rom_mem = Memory(width=16, depth=ROM_WORDS)
                 m.submodules.rom_rd = rom_rd = self._rom_mem.read_port()
-                m.submodules.rom_wr = rom_wr = self._rom_mem.write_port(granularity=8)
+                m.submodules.rom_wr = rom_wr = self._rom_mem.write_port()
                 m.d.comb += [
                     rom_rd.addr.eq(addr),
                     rd_data.eq(rom_rd.data),
-                    rom_wr.addr.eq(addr),
-                    rom_wr.data.eq(self._rom_wr_data.replicate(2)),
-                    rom_wr.en.eq(wr_en),
+                    rom_wr.addr.eq(self._rom_wr_addr),
+                    rom_wr.data.eq(self._rom_wr_data),
+                    rom_wr.en.eq(self._rom_wr_en),
+                    # INIT only reads up to rom.INIT_END.
+                    self._rom_init_ready.eq(
+                        self._rom_wr_addr >= math.ceil(rom.INIT_END / 2)
+                    ),
                 ]
 
     def elaborate_submodules(self, m: Module, platform: Platform):
@@ -478,22 +536,84 @@ class OLED(Component):
 
         m.submodules.fifo_in = self.fifo_in
 
-        with m.If(self._rom_writer.busy):
-            connect(m, flipped(self.i2c_bus), self._rom_writer.i2c_bus)
-            connect(m, flipped(self.rom_bus), self._rom_writer.rom_bus)
-        with m.Elif(self._locator.busy):
-            connect(m, flipped(self.i2c_bus), self._locator.i2c_bus)
-        with m.Elif(self._clser.busy):
-            connect(m, flipped(self.i2c_bus), self._clser.i2c_bus)
-        with m.Elif(self._scroller.busy):
-            connect(m, flipped(self.i2c_bus), self._scroller.i2c_bus)
-            connect(m, flipped(self.rom_bus), self._scroller.rom_bus)
-        with m.Else():
-            connect(m, flipped(self.i2c_bus), self.own_i2c_bus)
-            connect(m, flipped(self.rom_bus), self.own_rom_bus)
+        # Bus ownership is registered so the bus mux decodes a single register
+        # instead of a priority chain over every submodule's busy.  A submodule
+        # takes the buses when strobed, and hands them back the cycle after it
+        # finishes.
+        owners = [
+            (OLED.BusOwner.ROM_WRITER, self._rom_writer),
+            (OLED.BusOwner.LOCATOR, self._locator),
+            (OLED.BusOwner.CLSER, self._clser),
+            (OLED.BusOwner.SCROLLER, self._scroller),
+        ]
+        with m.Switch(self._bus_owner):
+            for owner, submodule in owners:
+                with m.Case(owner):
+                    with m.If(~submodule.stb & ~submodule.busy):
+                        m.d.sync += self._bus_owner.eq(OLED.BusOwner.OWN)
+        for owner, submodule in owners:
+            with m.If(submodule.stb):
+                m.d.sync += self._bus_owner.eq(owner)
+
+        OLED.elaborate_fabric(
+            m,
+            self._bus_owner,
+            I2CBus,
+            flipped(self.i2c_bus),
+            {
+                OLED.BusOwner.OWN: self.own_i2c_bus,
+                OLED.BusOwner.ROM_WRITER: self._rom_writer.i2c_bus,
+                OLED.BusOwner.LOCATOR: self._locator.i2c_bus,
+                OLED.BusOwner.CLSER: self._clser.i2c_bus,
+                OLED.BusOwner.SCROLLER: self._scroller.i2c_bus,
+            },
+        )
+        OLED.elaborate_fabric(
+            m,
+            self._bus_owner,
+            self.rom_bus.signature,
+            flipped(self.rom_bus),
+            {
+                OLED.BusOwner.ROM_WRITER: self._rom_writer.rom_bus,
+                OLED.BusOwner.SCROLLER: self._scroller.rom_bus,
+            },
+        )
 
         m.d.comb += self._locator.adjust.eq(self._scroller.adjusted)
 
+    @staticmethod
+    def elaborate_fabric(
+        m: Module,
+        owner: Signal,
+        signature: Signature,
+        target: FlippedInterface,
+        hosts: dict["OLED.BusOwner", PureInterface],
+    ):
+        # Shares one bus between all hosts without a mux per host: each host's
+        # outputs are masked by ownership and ORed together onto the target,
+        # and the target's outputs are broadcast.  Hosts that don't own the bus
+        # see their inputs at reset, as if they weren't connected at all.
+        #
+        # signature is the bus as the hosts see it; ports are matched by name.
+        assert target.signature.members == signature.flip().members
+        for host in hosts.values():
+            assert host.signature.members == signature.members
+
+        active = {o: owner == o for o in hosts}
+        for path, member in signature.members.flatten():
+            if member.is_signature:
+                continue
+            value = reduce(getattr, path, target)
+            ports = {o: reduce(getattr, path, h) for o, h in hosts.items()}
+            if member.flow == Out:
+                masked = [Mux(active[o], ports[o], 0) for o in hosts]
+                m.d.comb += value.eq(reduce(operator.or_, masked))
+            else:
+                for o in hosts:
+                    m.d.comb += ports[o].eq(
+                        Mux(active[o], value, member.init or 0)
+                    )
+
     def locate_states(self, m: Module):
         with m.State("LOCATE: ROW: WAIT"):
             with m.If(self.fifo_in.r_rdy):
@@ -504,12 +624,8 @@ class OLED(Component):
                     ]
                 with m.Else():
                     m.d.sync += self._locator.row.eq(0)
-                m.d.sync += self.fifo_in.r_en.eq(1)
-                m.next = "LOCATE: ROW: STROBED R_EN"
-
-        with m.State("LOCATE: ROW: STROBED R_EN"):
-            m.d.sync += self.fifo_in.r_en.eq(0)
-            m.next = "LOCATE: COL: WAIT"
+                m.d.comb += self.fifo_in.r_en.eq(1)
+                m.next = "LOCATE: COL: WAIT"
 
         with m.State("LOCATE: COL: WAIT"):
             with m.If(self.fifo_in.r_rdy):
@@ -520,18 +636,11 @@ class OLED(Component):
                     ]
                 with m.Else():
                     m.d.sync += self._locator.col.eq(0)
-                m.d.sync += [
+                m.d.comb += [
                     self.fifo_in.r_en.eq(1),
                     self._locator.stb.eq(1),
                 ]
-                m.next = "LOCATE: COL: STROBED R_EN"
-
-        with m.State("LOCATE: COL: STROBED R_EN"):
-            m.d.sync += [
-                self.fifo_in.r_en.eq(0),
-                self._locator.stb.eq(0),
-            ]
-            m.next = "LOCATE: UNSTROBED LOCATOR"
+                m.next = "LOCATE: UNSTROBED LOCATOR"
 
         with m.State("LOCATE: UNSTROBED LOCATOR"):
             with m.If(~self._locator.busy):
@@ -543,202 +652,230 @@ class OLED(Component):
 
         with m.State("PRINT: COUNT: WAIT"):
             with m.If(self.fifo_in.r_rdy):
-                m.d.sync += [
-                    self.fifo_in.r_en.eq(1),
-                    remaining.eq(self.fifo_in.r_data),
-                ]
-                m.next = "PRINT: COUNT: STROBED R_EN"
-
-        with m.State("PRINT: COUNT: STROBED R_EN"):
-            m.d.sync += self.fifo_in.r_en.eq(0)
-            with m.If(remaining == 0):
-                m.d.sync += self.result.eq(OLED.Result.SUCCESS)
-                m.next = "IDLE"
-            with m.Else():
-                m.next = "PRINT: DATA: WAIT"
+                m.d.comb += self.fifo_in.r_en.eq(1)
+                m.d.sync += remaining.eq(self.fifo_in.r_data)
+                with m.If(self.fifo_in.r_data == 0):
+                    m.d.sync += self.result.eq(OLED.Result.SUCCESS)
+                    m.next = "IDLE"
+                with m.Else():
+                    m.next = "PRINT: DATA: WAIT"
 
         with m.State("PRINT: DATA: WAIT"):
             with m.If(self.fifo_in.r_rdy):
-                m.d.sync += [
-                    self.fifo_in.r_en.eq(1),
-                    self._chpr_data.eq(self.fifo_in.r_data),
-                    self._chpr_run.eq(1),
-                ]
+                m.d.comb += self.fifo_in.r_en.eq(1)
+                m.d.sync += self.chpr_start(self.fifo_in.r_data)
                 m.next = "PRINT: DATA: CHPR RUNNING"
 
         with m.State("PRINT: DATA: CHPR RUNNING"):
-            m.d.sync += self.fifo_in.r_en.eq(0)
-            with m.If(~self._chpr_run):
+            with m.If(self._chpr_done):
                 with m.If(remaining == 1):
                     m.d.sync += self.result.eq(OLED.Result.SUCCESS)
                     m.next = "IDLE"
                 with m.Else():
                     m.d.sync += remaining.eq(remaining - 1)
-                    m.next = "PRINT: DATA: WAIT"
+                    # Start the next character back-to-back if it's here.
+                    with m.If(self.fifo_in.r_rdy):
+                        m.d.comb += self.fifo_in.r_en.eq(1)
+                        m.d.sync += self.chpr_start(self.fifo_in.r_data)
+                    with m.Else():
+                        m.next = "PRINT: DATA: WAIT"
+
+    @staticmethod
+    def next_pos(pos: Value) -> Value:
+        # Rows and columns run 1 to 16.  A 17-entry successor table is one LUT
+        # level, where the adder would need a carry chain.
+        return Array(C(p + 1 if p < 16 else 1, 5) for p in range(17))[pos]
+
+    def hex_lookup(self, m: Module, nibble: Value):
+        # Every state printing hex shares the one ROM: each routes the nibble
+        # it wants in, and so only a 4-bit mux sits in front of it.  The digit
+        # is on _hex_char from the next cycle.
+        m.d.comb += self._hex_nibble.eq(nibble)
+
+    def chpr_start(self, data: Value | int) -> list[Statement]:
+        # The glyph index is worked out here, as the character comes in, so
+        # the adder isn't on chpr_fsm's path to the ROMWriter.
+        #
+        # _chpr_run is a one-cycle strobe: chpr_fsm's IDLE clears it as it
+        # takes the character, and signals completion on _chpr_done, which is
+        # combinatorial.  Callers may therefore start the next character in
+        # the very cycle _chpr_done is seen; registering the start here is
+        # what lets chpr_fsm be back in IDLE to meet it.
+        return [
+            self._chpr_data.eq(data),
+            self._chpr_index.eq(rom.OFFSET_CHAR + data),
+            self._chpr_run.eq(1),
+        ]
 
     def chpr_fsm(self, m: Module):
-        with m.FSM():
+        with m.FSM() as fsm:
             with m.State("IDLE"):
                 with m.If(self._chpr_run):
+                    m.d.sync += self._chpr_run.eq(0)
                     with m.If(self._chpr_data == 13):
                         # CR
                         m.d.sync += [
                             self._col.eq(1),
                             self._locator.col.eq(1),
                             self._locator.row.eq(0),
-                            self._locator.stb.eq(1),
                         ]
-                        m.next = "CHPR: STROBED LOCATOR"
+                        m.d.comb += self._locator.stb.eq(1)
+                        m.next = "CHPR: UNSTROBED LOCATOR"
                     with m.Elif(self._chpr_data == 10):
                         # LF
                         with m.If(self._row == 16):
-                            m.d.sync += [
-                                self._col.eq(1),
-                                self._scroller.stb.eq(1),
-                            ]
-                            m.next = "CHPR: STROBED SCROLLER"
+                            m.d.sync += self._col.eq(1)
+                            m.d.comb += self._scroller.stb.eq(1)
+                            m.next = "CHPR: UNSTROBED SCROLLER"
                         with m.Else():
                             m.d.sync += [
                                 self._col.eq(1),
-                                self._row.eq(self._row + 1),
-                                self._locator.row.eq(self._row + 1),
+                                self._row.eq(OLED.next_pos(self._row)),
+                                self._locator.row.eq(OLED.next_pos(self._row)),
                                 self._locator.col.eq(1),
-                                self._locator.stb.eq(1),
                             ]
-                            m.next = "CHPR: STROBED LOCATOR"
+                            m.d.comb += self._locator.stb.eq(1)
+                            m.next = "CHPR: UNSTROBED LOCATOR"
                     with m.Else():
-                        m.d.sync += [
-                            self._rom_writer.index.eq(
-                                rom.OFFSET_CHAR + self._chpr_data
-                            ),
+                        m.d.comb += [
+                            self._rom_writer.index.eq(self._chpr_index),
                             self._rom_writer.stb.eq(1),
                         ]
-                        m.next = "CHPR: STROBED ROM WRITER"
-
-            with m.State("CHPR: STROBED ROM WRITER"):
-                m.d.sync += self._rom_writer.stb.eq(0)
-                with m.If(~self._chpr_advance):
-                    m.d.sync += self._chpr_advance.eq(1)
-                    m.next = "CHPR: UNSTROBED ROM WRITER"
-                with m.Elif(self._col == 16):
-                    with m.If(self._row == 16):
-                        m.d.sync += self._col.eq(1)
-                        m.next = "CHPR: UNSTROBED ROM WRITER, NEEDS SCROLL"
-                    with m.Else():
-                        m.d.sync += [
-                            self._col.eq(1),
-                            self._row.eq(self._row + 1),
-                        ]
-                        m.next = "CHPR: UNSTROBED ROM WRITER"
-                with m.Else():
-                    m.d.sync += self._col.eq(self._col + 1)
-                    m.next = "CHPR: UNSTROBED ROM WRITER"
+                        # Advance the cursor while the glyph's written.
+                        with m.If(~self._chpr_advance):
+                            m.d.sync += self._chpr_advance.eq(1)
+                            m.next = "CHPR: UNSTROBED ROM WRITER"
+                        with m.Elif(self._col == 16):
+                            with m.If(self._row == 16):
+                                m.d.sync += self._col.eq(1)
+                                m.next = "CHPR: UNSTROBED ROM WRITER, NEEDS SCROLL"
+                            with m.Else():
+                                m.d.sync += [
+                                    self._col.eq(1),
+                                    self._row.eq(OLED.next_pos(self._row)),
+                                ]
+                                m.next = "CHPR: UNSTROBED ROM WRITER"
+                        with m.Else():
+                            m.d.sync += self._col.eq(OLED.next_pos(self._col))
+                            m.next = "CHPR: UNSTROBED ROM WRITER"
 
             with m.State("CHPR: UNSTROBED ROM WRITER"):
+                # We can't rely on the SH1107's column auto-increment to land
+                # us at the next character: text columns are pages, so moving
+                # right means a new page, and the glyph just written has left
+                # the column address 8 past where the next one needs to go.
                 with m.If(~self._rom_writer.busy):
                     m.d.sync += [
                         self._locator.row.eq(self._row),
                         self._locator.col.eq(self._col),
-                        self._locator.stb.eq(1),
                     ]
-                    m.next = "CHPR: STROBED LOCATOR"
+                    m.d.comb += self._locator.stb.eq(1)
+                    m.next = "CHPR: UNSTROBED LOCATOR"
 
             with m.State("CHPR: UNSTROBED ROM WRITER, NEEDS SCROLL"):
                 with m.If(~self._rom_writer.busy):
-                    m.d.sync += self._scroller.stb.eq(1)
-                    m.next = "CHPR: STROBED SCROLLER"
-
-            with m.State("CHPR: STROBED SCROLLER"):
-                m.d.sync += self._scroller.stb.eq(0)
-                m.next = "CHPR: UNSTROBED SCROLLER"
+                    m.d.comb += self._scroller.stb.eq(1)
+                    m.next = "CHPR: UNSTROBED SCROLLER"
 
             with m.State("CHPR: UNSTROBED SCROLLER"):
                 with m.If(~self._scroller.busy):
                     m.d.sync += [
                         self._locator.row.eq(self._row),
                         self._locator.col.eq(self._col),
-                        self._locator.stb.eq(1),
                     ]
-                    m.next = "CHPR: STROBED LOCATOR"
-
-            with m.State("CHPR: STROBED LOCATOR"):
-                m.d.sync += self._locator.stb.eq(0)
-                m.next = "CHPR: UNSTROBED LOCATOR"
+                    m.d.comb += self._locator.stb.eq(1)
+                    m.next = "CHPR: UNSTROBED LOCATOR"
 
             with m.State("CHPR: UNSTROBED LOCATOR"):
                 with m.If(~self._locator.busy):
-                    m.d.sync += self._chpr_run.eq(0)
+                    m.d.comb += self._chpr_done.eq(1)
                     m.next = "IDLE"
 
+        fsm.state.attrs["fsm_encoding"] = "one-hot"
+
+    def rom_load_fsm(self, m: Module, platform: Platform):
+        with m.FSM() as fsm:
+            with m.State("BEGIN"):
+                # The SPIFR doesn't look at addr or len until it's well into
+                # the transfer, so the strobe can go with them.
+                m.d.sync += [
+                    self.spifr_bus.addr.eq(platform.flash_rom_base),
+                    self.spifr_bus.len.eq(ROM_WORDS),
+                ]
+                m.d.comb += self.spifr_bus.stb.eq(1)
+                m.next = "WAIT SPIFR"
+
+            with m.State("WAIT SPIFR"):
+                # Each beat is a whole ROM word; register it, and write it the
+                # cycle after it arrives, so the SPIFR's output isn't wired
+                # straight into the memory.  Beats are at least 16 SPI clocks
+                # apart, so the write port always keeps up and nothing more
+                # needs buffering.  The SPIFR counts the words for us, so
+                # there's no need to compare against the end.
+                m.d.sync += [
+                    self._rom_wr_en.eq(self.spifr_bus.valid),
+                    self._rom_wr_data.eq(self.spifr_bus.data),
+                ]
+                with m.If(self._rom_wr_en):
+                    m.d.sync += self._rom_wr_addr.eq(self._rom_wr_addr + 1)
+                with m.If(
+                    ~self.spifr_bus.valid & ~self._rom_wr_en & ~self.spifr_bus.busy
+                ):
+                    m.d.sync += self._rom_loaded.eq(1)
+                    m.next = "DONE"
+
+            with m.State("DONE"):
+                pass
+
+        fsm.state.attrs["fsm_encoding"] = "one-hot"
+
     def id_states(self, m: Module):
-        # XXX(Ch): hack just to test read capability The hex printing is
-        # duplicated in the print_byte states.
+        # XXX(Ch): hack just to test read capability.
 
-        id_recvd = Signal(8)
+        # Our last write was acknowledged and there's room for the next.
+        ready = Signal()
+        m.d.comb += ready.eq(
+            self.own_i2c_bus.busy
+            & self.own_i2c_bus.ack
+            & self.own_i2c_bus.in_fifo_w_rdy
+        )
 
         with m.State("ID: START"):
-            m.d.sync += [
+            m.d.comb += [
                 self.own_i2c_bus.in_fifo_w_data.eq(0x178),
                 self.own_i2c_bus.in_fifo_w_en.eq(1),
             ]
-            m.next = "ID: START WRITE: STROBED W_EN"
-
-        with m.State("ID: START WRITE: STROBED W_EN"):
-            m.d.sync += [
-                self.own_i2c_bus.in_fifo_w_en.eq(0),
-                self.own_i2c_bus.stb.eq(1),
-            ]
-            m.next = "ID: START WRITE: STROBED STB"
+            m.next = "ID: START WRITE: STROBE"
 
-        with m.State("ID: START WRITE: STROBED STB"):
-            m.d.sync += self.own_i2c_bus.stb.eq(0)
+        with m.State("ID: START WRITE: STROBE"):
+            m.d.comb += self.own_i2c_bus.stb.eq(1)
             m.next = "ID: START WRITE: UNSTROBED STB"
 
         with m.State("ID: START WRITE: UNSTROBED STB"):
-            with m.If(
-                self.own_i2c_bus.busy
-                & self.own_i2c_bus.ack
-                & self.own_i2c_bus.in_fifo_w_rdy
-            ):
-                m.d.sync += [
+            with m.If(ready):
+                m.d.comb += [
                     self.own_i2c_bus.in_fifo_w_data.eq(0x00),  # Command/NC
                     self.own_i2c_bus.in_fifo_w_en.eq(1),
                 ]
-                m.next = "ID: WRITE CMD: STROBED W_EN"
+                m.next = "ID: WRITE CMD: UNSTROBED W_EN"
             with m.Elif(~self.own_i2c_bus.busy):
                 m.d.sync += self.result.eq(OLED.Result.FAILURE)
                 m.next = "IDLE"
 
-        with m.State("ID: WRITE CMD: STROBED W_EN"):
-            m.d.sync += self.own_i2c_bus.in_fifo_w_en.eq(0)
-            m.next = "ID: WRITE CMD: UNSTROBED W_EN"
-
         with m.State("ID: WRITE CMD: UNSTROBED W_EN"):
-            with m.If(
-                self.own_i2c_bus.busy
-                & self.own_i2c_bus.ack
-                & self.own_i2c_bus.in_fifo_w_rdy
-            ):
-                m.d.sync += [
+            with m.If(ready):
+                m.d.comb += [
                     self.own_i2c_bus.in_fifo_w_data.eq(0x179),
                     self.own_i2c_bus.in_fifo_w_en.eq(1),
                 ]
-                m.next = "ID: START READ: STROBED W_EN"
+                m.next = "ID: START READ: UNSTROBED W_EN"
             with m.Elif(~self.own_i2c_bus.busy):
                 m.d.sync += self.result.eq(OLED.Result.FAILURE)
                 m.next = "IDLE"
 
-        with m.State("ID: START READ: STROBED W_EN"):
-            m.d.sync += self.own_i2c_bus.in_fifo_w_en.eq(0)
-            m.next = "ID: START READ: UNSTROBED W_EN"
-
         with m.State("ID: START READ: UNSTROBED W_EN"):
-            with m.If(
-                self.own_i2c_bus.busy
-                & self.own_i2c_bus.ack
-                & self.own_i2c_bus.in_fifo_w_rdy
-            ):
-                m.d.sync += [
+            with m.If(ready):
+                m.d.comb += [
                     self.own_i2c_bus.in_fifo_w_data.eq(0x00),
                     self.own_i2c_bus.in_fifo_w_en.eq(1),
                 ]
@@ -748,155 +885,99 @@ class OLED(Component):
                 m.next = "IDLE"
 
         with m.State("ID: RECV: WAIT"):
-            m.d.sync += self.own_i2c_bus.in_fifo_w_en.eq(0)
             with m.If(self.own_i2c_bus.out_fifo_r_rdy):
-                m.d.sync += [
-                    id_recvd.eq(self.own_i2c_bus.out_fifo_r_data),
-                    self.own_i2c_bus.out_fifo_r_en.eq(1),
-                ]
-                m.next = "ID: RECV: STROBED R_EN"
+                m.next = "ID: RECV: WAIT FOR STOP"
             with m.Elif(~self.own_i2c_bus.busy):
                 m.d.sync += self.result.eq(OLED.Result.FAILURE)
                 m.next = "IDLE"
 
-        with m.State("ID: RECV: STROBED R_EN"):
-            m.d.sync += self.own_i2c_bus.out_fifo_r_en.eq(0)
+        with m.State("ID: RECV: WAIT FOR STOP"):
+            # The byte waits in the I2C's out FIFO until we print it; nothing
+            # else is read this transaction.
             with m.If(~self.own_i2c_bus.busy):
-                first_half = id_recvd[4:8]
-                m.d.sync += [
-                    self._chpr_data.eq(
-                        Mux(
-                            first_half > 9,
-                            ord("A") + first_half - 10,
-                            ord("0") + first_half,
-                        )
-                    ),
-                    self._chpr_run.eq(1),
-                ]
-                m.next = "ID: FIRST HALF: CHPR RUNNING"
-
-        with m.State("ID: FIRST HALF: CHPR RUNNING"):
-            with m.If(~self._chpr_run):
-                second_half = id_recvd[:4]
-                m.d.sync += [
-                    self._chpr_data.eq(
-                        Mux(
-                            second_half > 9,
-                            ord("A") + second_half - 10,
-                            ord("0") + second_half,
-                        )
-                    ),
-                    self._chpr_run.eq(1),
-                ]
-                m.next = "ID: SECOND HALF: CHPR RUNNING"
-
-        with m.State("ID: SECOND HALF: CHPR RUNNING"):
-            with m.If(~self._chpr_run):
-                m.d.sync += self.result.eq(OLED.Result.SUCCESS)
-                m.next = "IDLE"
+                m.d.comb += self.own_i2c_bus.out_fifo_r_en.eq(1)
+                self.hex_print(m, self.own_i2c_bus.out_fifo_r_data)
 
     def print_byte_states(self, m: Module):
-        second_half = Signal(4)
-
         with m.State("PRINT_BYTE: START"):
             with m.If(self.fifo_in.r_rdy):
-                first_half = self.fifo_in.r_data[4:8]
-                m.d.sync += [
-                    second_half.eq(self.fifo_in.r_data[:4]),
-                    self.fifo_in.r_en.eq(1),
-                    self._chpr_data.eq(
-                        Mux(
-                            first_half > 9,
-                            ord("A") + first_half - 10,
-                            ord("0") + first_half,
-                        )
-                    ),
-                    self._chpr_run.eq(1),
-                ]
-                m.next = "PRINT_BYTE: STROBED R_EN, CHPR RUNNING"
-
-        with m.State("PRINT_BYTE: STROBED R_EN, CHPR RUNNING"):
-            m.d.sync += self.fifo_in.r_en.eq(0)
-            with m.If(~self._chpr_run):
-                m.d.sync += [
-                    self._chpr_data.eq(
-                        Mux(
-                            second_half > 9,
-                            ord("A") + second_half - 10,
-                            ord("0") + second_half,
-                        )
-                    ),
-                    self._chpr_run.eq(1),
-                ]
-                m.next = "PRINT_BYTE: SECOND HALF: CHPR RUNNING"
-
-        with m.State("PRINT_BYTE: SECOND HALF: CHPR RUNNING"):
-            with m.If(~self._chpr_run):
+                m.d.comb += self.fifo_in.r_en.eq(1)
+                self.hex_print(m, self.fifo_in.r_data)
+
+    def hex_print(self, m: Module, byte: Value, *, spi_test: bool = False):
+        # Print byte as two hex digits, then finish the command successfully,
+        # or return to SPI_TEST for the next byte.
+        m.d.sync += [
+            self._hex_low_nibble.eq(byte[:4]),
+            self._hex_spi_test.eq(spi_test),
+        ]
+        self.hex_lookup(m, byte[4:8])
+        m.next = "HEX: FIRST HALF"
+
+    def hex_states(self, m: Module):
+        with m.State("HEX: FIRST HALF"):
+            m.d.sync += self.chpr_start(self._hex_char)
+            self.hex_lookup(m, self._hex_low_nibble)
+            m.next = "HEX: FIRST HALF: CHPR RUNNING"
+
+        with m.State("HEX: FIRST HALF: CHPR RUNNING"):
+            # The ROM is free while the first character prints; hold the second
+            # digit on its output, ready to start straight from there.
+            self.hex_lookup(m, self._hex_low_nibble)
+            with m.If(self._chpr_done):
+                m.d.sync += self.chpr_start(self._hex_char)
+                m.next = "HEX: SECOND HALF: CHPR RUNNING"
+
+        with m.State("HEX: SECOND HALF: CHPR RUNNING"):
+            with m.If(self._chpr_done & ~self._hex_spi_test):
                 m.d.sync += self.result.eq(OLED.Result.SUCCESS)
                 m.next = "IDLE"
+            if self._spi_test:
+                with m.If(self._chpr_done & self._hex_spi_test):
+                    m.next = "SPI_TEST: WRITE LOOP"
 
     def spi_test_states(self, m: Module, platform: Platform):
+        # Half a screen of hex.  The FIFO below holds the whole read, so the
+        # SPIFR bursts it in one go, and a power-of-two depth keeps the
+        # FIFO's pointers wrapping for free.
         TO_READ = 0x20
 
-        m.submodules.spi_test_fifo = fifo = SyncFIFO(width=8, depth=TO_READ)
+        # The SPIFR hands us whole words; keep them that way, and print the two
+        # bytes of each in turn.
+        m.submodules.spi_test_fifo = fifo = SyncFIFO(width=16, depth=TO_READ // 2)
 
-        second_half = Signal(4)
+        # Counts bytes, not words: TO_READ is even, so the low bit says which
+        # half of the word at the head of the FIFO is next.
+        remaining = Signal(range(TO_READ + 1))
+
+        # Once the ROM's loaded, SPI_TEST is the SPIFR's only user, and the
+        # FIFO's deep enough for everything it asks for.  Filling it whatever
+        # state we're in lets printing start with the first word.
+        m.d.comb += [
+            fifo.w_data.eq(self.spifr_bus.data),
+            fifo.w_en.eq(self._rom_loaded & self.spifr_bus.valid),
+        ]
 
         with m.State("SPI_TEST: START"):
             m.d.sync += [
                 self.spifr_bus.addr.eq(platform.flash_rom_base),
-                self.spifr_bus.len.eq(0x100),
-                self.spifr_bus.stb.eq(1),
+                self.spifr_bus.len.eq(TO_READ // 2),
+                remaining.eq(TO_READ),
             ]
-            m.next = "SPI_TEST: WAIT"
-
-        with m.State("SPI_TEST: WAIT"):
-            m.d.sync += [
-                self.spifr_bus.stb.eq(0),
-                fifo.w_en.eq(0),
-            ]
-            with m.If(fifo.r_level == TO_READ):
-                m.next = "SPI_TEST: WRITE LOOP"
-            with m.Elif(self.spifr_bus.valid):
-                m.d.sync += [
-                    fifo.w_data.eq(self.spifr_bus.data),
-                    fifo.w_en.eq(1),
-                ]
+            m.d.comb += self.spifr_bus.stb.eq(1)
+            m.next = "SPI_TEST: WRITE LOOP"
 
         with m.State("SPI_TEST: WRITE LOOP"):
-            with m.If(fifo.r_rdy):
-                first_half = fifo.r_data[4:8]
-                m.d.sync += [
-                    second_half.eq(fifo.r_data[:4]),
-                    fifo.r_en.eq(1),
-                    self._chpr_data.eq(
-                        Mux(
-                            first_half > 9,
-                            ord("A") + first_half - 10,
-                            ord("0") + first_half,
-                        )
-                    ),
-                    self._chpr_run.eq(1),
-                ]
-                m.next = "SPI_TEST: STROBED R_EN, CHPR RUNNING"
-            with m.Else():
+            with m.If(remaining == 0):
+                m.d.sync += self.result.eq(OLED.Result.SUCCESS)
                 m.next = "IDLE"
-
-        with m.State("SPI_TEST: STROBED R_EN, CHPR RUNNING"):
-            m.d.sync += fifo.r_en.eq(0)
-            with m.If(~self._chpr_run):
-                m.d.sync += [
-                    self._chpr_data.eq(
-                        Mux(
-                            second_half > 9,
-                            ord("A") + second_half - 10,
-                            ord("0") + second_half,
-                        )
-                    ),
-                    self._chpr_run.eq(1),
-                ]
-                m.next = "SPI_TEST: SECOND HALF: CHPR RUNNING"
-
-        with m.State("SPI_TEST: SECOND HALF: CHPR RUNNING"):
-            with m.If(~self._chpr_run):
-                m.next = "SPI_TEST: WRITE LOOP"
+            with m.Elif(fifo.r_rdy):
+                m.d.sync += remaining.eq(remaining - 1)
+                with m.If(~remaining[0]):
+                    self.hex_print(m, fifo.r_data[:8], spi_test=True)
+                with m.Else():
+                    # SyncFIFO falls through (r_data is good whenever r_rdy
+                    # is), and nothing else reads it, so r_en can be a
+                    # combinational strobe taking the word as it's used.
+                    m.d.comb += fifo.r_en.eq(1)
+                    self.hex_print(m, fifo.r_data[8:], spi_test=True)
@@ -1,4 +1,6 @@
-from amaranth import Elaboratable, Module, Signal
+from typing import Final
+
+from amaranth import Const, Elaboratable, Module, Mux, Signal
 from amaranth.lib.wiring import Component, In, Out
 
 from ...platform import Platform
@@ -7,190 +9,166 @@ from ..i2c import RW, I2CBus, Transfer
 
 __all__ = ["Clser"]
 
+_CONTROL_COMMAND_CONTINUED: Final[int] = ControlByte(True, "Command").to_byte()
+
+# What follows each page's first control byte, up to its pixels. The first
+# page starts at the top to reset the column; the rest start at
+# _PROLOGUE_PAGE. The current page is ORed into the page address byte.
+_PROLOGUE: Final[list[int]] = [
+    Cmd.SetLowerColumnAddress(0x0).to_byte(),
+    _CONTROL_COMMAND_CONTINUED,
+    Cmd.SetHigherColumnAddress(0x00).to_byte(),
+    _CONTROL_COMMAND_CONTINUED,
+    Cmd.SetPageAddress(0x00).to_byte(),
+    ControlByte(False, "Data").to_byte(),
+]
+_PROLOGUE_PAGE: Final[int] = 4
+
 
 class Clser(Component):
     _addr: int
+    _cols: int
+    _pages: int
 
     stb: Out(1)
     i2c_bus: Out(I2CBus)
 
     busy: In(1)
 
-    _current_page: Signal
-    _current_column: Signal
+    _position: Signal
+    _prologue_ix: Signal
 
-    def __init__(self, *, addr: int):
+    def __init__(self, *, addr: int, cols: int = 128, pages: int = 16):
         super().__init__()
+        # The column and page are bit fields of _position.
+        assert 0 < cols <= 128 and cols & (cols - 1) == 0
+        assert 0 < pages <= 16
         self._addr = addr
+        self._cols = cols
+        self._pages = pages
 
         self.stb = Signal()
 
         self.busy = Signal()
 
-        self._current_page = Signal(range(0x10))
-        self._current_column = Signal(range(0x81))
+        # Bytes written so far: the column in the low bits, then the page.
+        self._position = Signal(range(pages * cols + 1))
+        self._prologue_ix = Signal(range(len(_PROLOGUE)))
 
     def elaborate(self, platform: Platform) -> Elaboratable:
         m = Module()
 
         transfer = Transfer(self.i2c_bus.in_fifo_w_data)
-
-        with m.FSM():
+        column_bits = (self._cols - 1).bit_length()
+        column = self._position[:column_bits]
+        page = self._position[column_bits:]
+        prologue_start = Mux(page == 0, 0, _PROLOGUE_PAGE) if self._cols == 128 else 0
+        prologue = Const(int.from_bytes(bytes(_PROLOGUE), "little"), 8 * len(_PROLOGUE))
+
+        # Bytes are written to the I2C FIFO combinatorially, in the state that
+        # decides to send them, so no state exists only to lower w_en again.
+        # The FIFO is one deep: having just written, w_rdy is low on the next
+        # cycle, so waiting states can't send twice.
+        with m.FSM() as fsm:
             with m.State("IDLE"):
+                # We don't own the bus until the cycle after we're strobed.
                 with m.If(self.stb):
                     m.d.sync += [
                         self.busy.eq(1),
-                        self._current_page.eq(0),
-                        self._current_column.eq(0),
-                        transfer.kind.eq(Transfer.Kind.START),
-                        transfer.payload.start.addr.eq(self._addr),
-                        transfer.payload.start.rw.eq(RW.W),
-                        self.i2c_bus.in_fifo_w_en.eq(1),
+                        self._position.eq(0),
                     ]
-                    m.next = "START: ADDR: STROBED W_EN"
-
-            with m.State("START: ADDR: STROBED W_EN"):
-                m.d.sync += [
-                    self.i2c_bus.in_fifo_w_en.eq(0),
-                    self.i2c_bus.stb.eq(1),
+                    m.next = "START: ADDR"
+
+            with m.State("START: ADDR"):
+                m.d.comb += [
+                    transfer.kind.eq(Transfer.Kind.START),
+                    transfer.payload.start.addr.eq(self._addr),
+                    transfer.payload.start.rw.eq(RW.W),
+                    self.i2c_bus.in_fifo_w_en.eq(1),
                 ]
-                m.next = "START: ADDR: STROBED STB"
-
-            with m.State("START: ADDR: STROBED STB"):
-                m.d.sync += self.i2c_bus.stb.eq(0)
+                m.next = "START: ADDR: STB"
+
+            with m.State("START: ADDR: STB"):
+                m.d.comb += self.i2c_bus.stb.eq(1)
+                m.next = "START: ADDR: UNSTROBED STB"
+
+            # Each page is a single transaction: the commands that position it,
+            # each behind a Co=1 control byte, then one Co=0 data control byte
+            # and the page's pixels. At full width, only the first page needs
+            # the column reset; later pages carry on from where the column
+            # wrapped. Narrower clears reset it every page, since the column
+            # only wraps by itself at 128.
+            with m.State("START: ADDR: UNSTROBED STB"):
                 with m.If(self.i2c_bus.in_fifo_w_rdy):
-                    m.d.sync += [
+                    m.d.comb += [
                         transfer.kind.eq(Transfer.Kind.DATA),
-                        transfer.payload.data.eq(
-                            ControlByte(False, "Command").to_byte()
-                        ),
-                        self.i2c_bus.in_fifo_w_en.eq(1),
-                    ]
-                    m.next = "START: CONTROL: STROBED W_EN"
-
-            with m.State("START: CONTROL: STROBED W_EN"):
-                m.d.sync += self.i2c_bus.in_fifo_w_en.eq(0)
-                with m.If(self._current_page == 0):
-                    m.next = "START: CONTROL: UNSTROBED W_EN"
-                with m.Else():
-                    m.next = "START: COL HIGHER: UNSTROBED W_EN"
-
-            with m.State("START: CONTROL: UNSTROBED W_EN"):
-                with m.If(
-                    self.i2c_bus.busy & self.i2c_bus.ack & self.i2c_bus.in_fifo_w_rdy
-                ):
-                    byte = Cmd.SetLowerColumnAddress(0x0).to_byte()
-                    m.d.sync += [
-                        transfer.payload.data.eq(byte),
-                        self.i2c_bus.in_fifo_w_en.eq(1),
-                    ]
-                    m.next = "START: COL LOWER: STROBED W_EN"
-                with m.Elif(~self.i2c_bus.busy):
-                    m.d.sync += self.busy.eq(0)
-                    m.next = "IDLE"
-
-            with m.State("START: COL LOWER: STROBED W_EN"):
-                m.d.sync += self.i2c_bus.in_fifo_w_en.eq(0)
-                m.next = "START: COL LOWER: UNSTROBED W_EN"
-
-            with m.State("START: COL LOWER: UNSTROBED W_EN"):
-                with m.If(
-                    self.i2c_bus.busy & self.i2c_bus.ack & self.i2c_bus.in_fifo_w_rdy
-                ):
-                    byte = Cmd.SetHigherColumnAddress(0x00).to_byte()
-                    m.d.sync += [
-                        transfer.payload.data.eq(byte),
+                        transfer.payload.data.eq(_CONTROL_COMMAND_CONTINUED),
                         self.i2c_bus.in_fifo_w_en.eq(1),
                     ]
-                    m.next = "START: COL HIGHER: STROBED W_EN"
-                with m.Elif(~self.i2c_bus.busy):
-                    m.d.sync += self.busy.eq(0)
-                    m.next = "IDLE"
-
-            with m.State("START: COL HIGHER: STROBED W_EN"):
-                m.d.sync += self.i2c_bus.in_fifo_w_en.eq(0)
-                m.next = "START: COL HIGHER: UNSTROBED W_EN"
+                    m.d.sync += self._prologue_ix.eq(prologue_start)
+                    m.next = "START: PROLOGUE"
 
-            with m.State("START: COL HIGHER: UNSTROBED W_EN"):
+            with m.State("START: PROLOGUE"):
                 with m.If(
                     self.i2c_bus.busy & self.i2c_bus.ack & self.i2c_bus.in_fifo_w_rdy
                 ):
-                    byte = Cmd.SetPageAddress(0x00).to_byte() + self._current_page
-                    m.d.sync += [
-                        transfer.payload.data.eq(byte),
+                    m.d.comb += [
+                        transfer.payload.data.eq(
+                            prologue.word_select(self._prologue_ix, 8)
+                            | Mux(
+                                self._prologue_ix == _PROLOGUE_PAGE,
+                                page,
+                                0,
+                            )
+                        ),
                         self.i2c_bus.in_fifo_w_en.eq(1),
                     ]
-                    m.next = "LOOP: PAGE: STROBED W_EN"
+                    m.d.sync += self._prologue_ix.eq(self._prologue_ix + 1)
+                    with m.If(self._prologue_ix == len(_PROLOGUE) - 1):
+                        m.next = "LOOP: CONTROL: UNSTROBED W_EN"
                 with m.Elif(~self.i2c_bus.busy):
-                    m.d.sync += self.busy.eq(0)
-                    m.next = "IDLE"
+                    m.next = "ABORT"
 
-            with m.State("LOOP: PAGE: STROBED W_EN"):
-                m.d.sync += self.i2c_bus.in_fifo_w_en.eq(0)
-                m.next = "LOOP: PAGE: UNSTROBED W_EN"
-
-            with m.State("LOOP: PAGE: UNSTROBED W_EN"):
+            with m.State("LOOP: CONTROL: UNSTROBED W_EN"):
                 with m.If(
                     self.i2c_bus.busy & self.i2c_bus.ack & self.i2c_bus.in_fifo_w_rdy
                 ):
-                    m.d.sync += [
-                        transfer.kind.eq(Transfer.Kind.START),
-                        transfer.payload.start.addr.eq(self._addr),
-                        transfer.payload.start.rw.eq(RW.W),
+                    m.d.comb += [
+                        transfer.payload.data.eq(0x00),
                         self.i2c_bus.in_fifo_w_en.eq(1),
                     ]
-                    m.next = "LOOP: ADDR: STROBED W_EN"
+                    m.d.sync += self._position.eq(self._position + 1)
+                    with m.If(column == self._cols - 1):
+                        m.next = "LOOP: PAGE DONE"
                 with m.Elif(~self.i2c_bus.busy):
-                    m.d.sync += self.busy.eq(0)
-                    m.next = "IDLE"
+                    m.next = "ABORT"
 
-            with m.State("LOOP: ADDR: STROBED W_EN"):
-                m.d.sync += self.i2c_bus.in_fifo_w_en.eq(0)
-                m.next = "LOOP: ADDR: UNSTROBED W_EN"
-
-            with m.State("LOOP: ADDR: UNSTROBED W_EN"):
-                with m.If(self.i2c_bus.in_fifo_w_rdy):
-                    m.d.sync += [
-                        transfer.kind.eq(Transfer.Kind.DATA),
-                        transfer.payload.data.eq(ControlByte(False, "Data").to_byte()),
-                    ]
-                    m.d.sync += self.i2c_bus.in_fifo_w_en.eq(1)
-                    m.next = "LOOP: CONTROL: STROBED W_EN"
-
-            with m.State("LOOP: CONTROL: STROBED W_EN"):
-                m.d.sync += self.i2c_bus.in_fifo_w_en.eq(0)
-                m.next = "LOOP: CONTROL: UNSTROBED W_EN"
-
-            with m.State("LOOP: CONTROL: UNSTROBED W_EN"):
+            with m.State("LOOP: PAGE DONE"):
                 with m.If(
                     self.i2c_bus.busy & self.i2c_bus.ack & self.i2c_bus.in_fifo_w_rdy
                 ):
-                    with m.If(self._current_column != 0x80):
-                        m.d.sync += [
-                            transfer.payload.data.eq(0x00),
-                            self.i2c_bus.in_fifo_w_en.eq(1),
-                            self._current_column.eq(self._current_column + 1),
-                        ]
-                        m.next = "LOOP: CONTROL: STROBED W_EN"
-                    with m.Elif(self._current_page != 0x0F):
-                        m.d.sync += [
-                            self._current_column.eq(0),
-                            self._current_page.eq(self._current_page + 1),
+                    with m.If(page != self._pages):
+                        m.d.comb += [
                             transfer.kind.eq(Transfer.Kind.START),
                             transfer.payload.start.addr.eq(self._addr),
                             transfer.payload.start.rw.eq(RW.W),
                             self.i2c_bus.in_fifo_w_en.eq(1),
                         ]
-                        m.next = "LOOP: NEXT PAGE: ADDR: STROBED W_EN"
+                        m.next = "START: ADDR: UNSTROBED STB"
                     with m.Else():
                         m.d.sync += self.busy.eq(0)
                         m.next = "IDLE"
                 with m.Elif(~self.i2c_bus.busy):
-                    m.d.sync += self.busy.eq(0)
-                    m.next = "IDLE"
+                    m.next = "ABORT"
+
+            with m.State("ABORT"):
+                # The I2C transaction ended early; give up.
+                m.d.sync += self.busy.eq(0)
+                m.next = "IDLE"
 
-            with m.State("LOOP: NEXT PAGE: ADDR: STROBED W_EN"):
-                m.d.sync += self.i2c_bus.in_fifo_w_en.eq(0)
-                m.next = "START: ADDR: STROBED STB"
+        # Most transitions share the same I2C readiness guard; one-hot keeps each
+        # state's decode to a single bit rather than a compare on the state
+        # register.
+        fsm.state.attrs["fsm_encoding"] = "one-hot"
 
         return m
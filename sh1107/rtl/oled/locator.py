@@ -1,4 +1,6 @@
-from amaranth import Elaboratable, Module, Mux, Signal
+from typing import Final
+
+from amaranth import Elaboratable, Module, Mux, Signal, Value
 from amaranth.lib.wiring import Component, In, Out
 
 from ...platform import Platform
@@ -7,6 +9,11 @@ from ..i2c import RW, I2CBus, Transfer
 
 __all__ = ["Locator"]
 
+_CONTROL_COMMAND: Final[int] = ControlByte(False, "Command").to_byte()
+_SET_LOWER_COLUMN_0: Final[int] = Cmd.SetLowerColumnAddress(0x00).to_byte()
+_SET_HIGHER_COLUMN_0: Final[int] = Cmd.SetHigherColumnAddress(0x00).to_byte()
+_SET_PAGE_0: Final[int] = Cmd.SetPageAddress(0x00).to_byte()
+
 
 class Locator(Component):
     _addr: int
@@ -33,127 +40,110 @@ class Locator(Component):
         m.d.comb += self._adjusted_row.eq(self.row - 1 + self.adjust)
 
         transfer = Transfer(self.i2c_bus.in_fifo_w_data)
+        start_row = self.start_row()
 
-        with m.FSM():
+        # Bytes are written combinatorially in the state that sends them, as in
+        # Clser.
+        with m.FSM() as fsm:
             with m.State("IDLE"):
                 with m.If(self.stb):
-                    m.d.sync += [
-                        self.busy.eq(1),
-                        transfer.kind.eq(Transfer.Kind.START),
-                        transfer.payload.start.addr.eq(self._addr),
-                        transfer.payload.start.rw.eq(RW.W),
-                        self.i2c_bus.in_fifo_w_en.eq(1),
-                    ]
-                    m.next = "START: ADDR: STROBED W_EN"
-
-            with m.State("START: ADDR: STROBED W_EN"):
-                m.d.sync += [
-                    self.i2c_bus.in_fifo_w_en.eq(0),
-                    self.i2c_bus.stb.eq(1),
+                    m.d.sync += self.busy.eq(1)
+                    m.next = "START: ADDR"
+
+            with m.State("START: ADDR"):
+                m.d.comb += [
+                    transfer.kind.eq(Transfer.Kind.START),
+                    transfer.payload.start.addr.eq(self._addr),
+                    transfer.payload.start.rw.eq(RW.W),
+                    self.i2c_bus.in_fifo_w_en.eq(1),
                 ]
-                m.next = "START: ADDR: STROBED STB"
+                m.next = "START: ADDR: STB"
+
+            with m.State("START: ADDR: STB"):
+                m.d.comb += self.i2c_bus.stb.eq(1)
+                m.next = "START: ADDR: UNSTROBED STB"
 
-            with m.State("START: ADDR: STROBED STB"):
-                m.d.sync += self.i2c_bus.stb.eq(0)
+            with m.State("START: ADDR: UNSTROBED STB"):
                 with m.If(self.i2c_bus.in_fifo_w_rdy):
-                    m.d.sync += [
+                    m.d.comb += [
                         transfer.kind.eq(Transfer.Kind.DATA),
-                        transfer.payload.data.eq(
-                            ControlByte(False, "Command").to_byte()
-                        ),
+                        transfer.payload.data.eq(_CONTROL_COMMAND),
                         self.i2c_bus.in_fifo_w_en.eq(1),
                     ]
-                    m.next = "START: CONTROL: STROBED W_EN"
-
-            with m.State("START: CONTROL: STROBED W_EN"):
-                m.d.sync += self.i2c_bus.in_fifo_w_en.eq(0)
-                m.next = "START: CONTROL: UNSTROBED W_EN"
+                    m.next = "START: CONTROL: UNSTROBED W_EN"
 
             with m.State("START: CONTROL: UNSTROBED W_EN"):
                 with m.If(
                     self.i2c_bus.busy & self.i2c_bus.ack & self.i2c_bus.in_fifo_w_rdy
                 ):
                     with m.If(self.col != 0):
-                        byte = Cmd.SetPageAddress(0x00).to_byte() + 16 - self.col
-                        m.d.sync += [
+                        byte = _SET_PAGE_0 + 16 - self.col
+                        m.d.comb += [
                             transfer.payload.data.eq(byte),
                             self.i2c_bus.in_fifo_w_en.eq(1),
                         ]
-                        m.next = "START: PAGE: STROBED W_EN"
+                        with m.If(self.row != 0):
+                            m.next = "START: PAGE: UNSTROBED W_EN"
+                        with m.Else():
+                            m.next = "FIN: WAIT I2C DONE"
                     with m.Elif(self.row != 0):
-                        self.start_row(m)
-                        m.next = "START: COL LOWER: STROBED W_EN"
+                        m.d.comb += [
+                            transfer.payload.data.eq(start_row),
+                            self.i2c_bus.in_fifo_w_en.eq(1),
+                        ]
+                        m.next = "START: COL LOWER: UNSTROBED W_EN"
                     with m.Else():
                         m.d.sync += self.busy.eq(0)
                         m.next = "IDLE"
                 with m.Elif(~self.i2c_bus.busy):
-                    m.d.sync += self.busy.eq(0)
-                    m.next = "IDLE"
-
-            with m.State("START: PAGE: STROBED W_EN"):
-                m.d.sync += self.i2c_bus.in_fifo_w_en.eq(0)
-                m.next = "START: PAGE: UNSTROBED W_EN"
+                    m.next = "ABORT"
 
             with m.State("START: PAGE: UNSTROBED W_EN"):
-                with m.If(self.row != 0):
-                    with m.If(
-                        self.i2c_bus.busy
-                        & self.i2c_bus.ack
-                        & self.i2c_bus.in_fifo_w_rdy
-                    ):
-                        self.start_row(m)
-                        m.next = "START: COL LOWER: STROBED W_EN"
-                    with m.Elif(~self.i2c_bus.busy):
-                        m.d.sync += self.busy.eq(0)
-                        m.next = "IDLE"
+                with m.If(
+                    self.i2c_bus.busy & self.i2c_bus.ack & self.i2c_bus.in_fifo_w_rdy
+                ):
+                    m.d.comb += [
+                        transfer.payload.data.eq(start_row),
+                        self.i2c_bus.in_fifo_w_en.eq(1),
+                    ]
+                    m.next = "START: COL LOWER: UNSTROBED W_EN"
                 with m.Elif(~self.i2c_bus.busy):
-                    m.d.sync += self.busy.eq(0)
-                    m.next = "IDLE"
-
-            with m.State("START: COL LOWER: STROBED W_EN"):
-                m.d.sync += self.i2c_bus.in_fifo_w_en.eq(0)
-                m.next = "START: COL LOWER: UNSTROBED W_EN"
+                    m.next = "ABORT"
 
             with m.State("START: COL LOWER: UNSTROBED W_EN"):
                 with m.If(
                     self.i2c_bus.busy & self.i2c_bus.ack & self.i2c_bus.in_fifo_w_rdy
                 ):
-                    byte = Cmd.SetHigherColumnAddress(0x00).to_byte() + (
-                        self._adjusted_row >> 1
-                    )
-                    m.d.sync += [
+                    byte = _SET_HIGHER_COLUMN_0 + (self._adjusted_row >> 1)
+                    m.d.comb += [
                         transfer.payload.data.eq(byte),
                         self.i2c_bus.in_fifo_w_en.eq(1),
                     ]
-                    m.next = "START: COL HIGHER: STROBED W_EN"
+                    m.next = "FIN: WAIT I2C DONE"
                 with m.Elif(~self.i2c_bus.busy):
-                    m.d.sync += self.busy.eq(0)
-                    m.next = "IDLE"
-
-            with m.State("START: COL HIGHER: STROBED W_EN"):
-                m.d.sync += self.i2c_bus.in_fifo_w_en.eq(0)
-                m.next = "START: COL HIGHER: UNSTROBED W_EN"
+                    m.next = "ABORT"
 
-            with m.State("START: COL HIGHER: UNSTROBED W_EN"):
+            # Whichever byte was last, wait for it to be acked and the
+            # transaction to finish.
+            with m.State("FIN: WAIT I2C DONE"):
                 with m.If(
                     ~self.i2c_bus.busy & self.i2c_bus.ack & self.i2c_bus.in_fifo_w_rdy
                 ):
                     m.d.sync += self.busy.eq(0)
                     m.next = "IDLE"
                 with m.Elif(~self.i2c_bus.busy):
-                    m.d.sync += self.busy.eq(0)
-                    m.next = "IDLE"
+                    m.next = "ABORT"
+
+            with m.State("ABORT"):
+                m.d.sync += self.busy.eq(0)
+                m.next = "IDLE"
+
+        # See Clser.
+        fsm.state.attrs["fsm_encoding"] = "one-hot"
 
         return m
 
-    def start_row(self, m: Module):
+    def start_row(self) -> Value:
         # For (adjusted) rows 0, 2, 4, 6, .., the column addresses are 0x00, 0x10, 0x20, ...
         # For (adjusted) rows 1, 3, 5, 7, .., the column addresses are 0x08, 0x18, 0x28, ...
-        byte = Cmd.SetLowerColumnAddress(0x00).to_byte() + Mux(
-            self._adjusted_row[0], 8, 0
-        )
-        transfer = Transfer(self.i2c_bus.in_fifo_w_data)
-        m.d.sync += [
-            transfer.payload.data.eq(byte),
-            self.i2c_bus.in_fifo_w_en.eq(1),
-        ]
+        return _SET_LOWER_COLUMN_0 + Mux(self._adjusted_row[0], 8, 0)
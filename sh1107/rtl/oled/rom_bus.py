@@ -6,6 +6,13 @@ __all__ = ["ROMBus"]
 
 
 class ROMBus(Signature):
+    """
+    Read-only bus onto the ROM.
+
+    data is valid two cycles after addr: one for the memory itself, and one for
+    the register on its output.
+    """
+
     def __init__(
         self,
         addr: ShapeCastable,
@@ -20,7 +27,5 @@ class ROMBus(Signature):
 
     @staticmethod
     def connect_read_port(m: Module, rom_rd: ReadPort, rom_bus: object):
-        m.d.comb += [
-            rom_rd.addr.eq(rom_bus.addr),
-            rom_bus.data.eq(rom_rd.data),
-        ]
+        m.d.comb += rom_rd.addr.eq(rom_bus.addr)
+        m.d.sync += rom_bus.data.eq(rom_rd.data)
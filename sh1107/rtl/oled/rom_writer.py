@@ -1,5 +1,3 @@
-from typing import cast
-
 from amaranth import Cat, Elaboratable, Module, Signal
 from amaranth.lib.wiring import Component, In, Out
 
@@ -28,7 +26,7 @@ class ROMWriter(Component):
         super().__init__()
         self._addr = addr
 
-        self._offset = Signal(range(rom.ROM_LENGTH))
+        self._offset = Signal(8)
         self._remain = Signal(range(rom.ROM_LENGTH))
 
     def elaborate(self, platform: Platform) -> Elaboratable:
@@ -36,7 +34,12 @@ class ROMWriter(Component):
 
         transfer = Transfer(self.i2c_bus.in_fifo_w_data)
 
-        with m.FSM():
+        # The header is read one byte a cycle while the I2C START goes out, and
+        # *offset is addressed as soon as OFFSET[1] arrives, so the first data
+        # byte is ready as the header completes.  ROM data always trails the
+        # address by two cycles; every send addresses the byte after it, which
+        # is then ready by the time the I2C can take another.
+        with m.FSM() as fsm:
             with m.State("IDLE"):
                 with m.If(self.stb):
                     m.d.sync += [
@@ -47,70 +50,59 @@ class ROMWriter(Component):
 
             with m.State("START: ADDRESSED OFFSET[0]"):
                 m.d.sync += self.rom_bus.addr.eq(self.rom_bus.addr + 1)
-                m.next = "START: ADDRESSED OFFSET[1], OFFSET[0] AVAILABLE"
-
-            with m.State("START: ADDRESSED OFFSET[1], OFFSET[0] AVAILABLE"):
-                m.d.sync += [
-                    self.rom_bus.addr.eq(self.rom_bus.addr + 1),
-                    self._offset.eq(self.rom_bus.data),
-                ]
-                m.next = "START: ADDRESSED LEN[0], OFFSET[1] AVAILABLE"
-
-            with m.State("START: ADDRESSED LEN[0], OFFSET[1] AVAILABLE"):
-                m.d.sync += [
-                    self.rom_bus.addr.eq(self.rom_bus.addr + 1),
-                    self._offset.eq(self._offset | self.rom_bus.data.shift_left(8)),
-                ]
-                m.next = "START: ADDRESSED LEN[1], LEN[0] AVAILABLE"
-
-            with m.State("START: ADDRESSED LEN[1], LEN[0] AVAILABLE"):
-                m.d.sync += [
-                    self._remain.eq(self.rom_bus.data),
-                    self.rom_bus.addr.eq(self._offset),
-                ]
-                m.next = "START: ADDRESSED *OFFSET, LEN[1] AVAILABLE"
-
-            with m.State("START: ADDRESSED *OFFSET, LEN[1] AVAILABLE"):
-                m.d.sync += [
-                    self._remain.eq(self._remain | self.rom_bus.data.shift_left(8)),
+                m.d.comb += [
                     transfer.kind.eq(Transfer.Kind.START),
                     transfer.payload.start.addr.eq(self._addr),
                     transfer.payload.start.rw.eq(RW.W),
                     self.i2c_bus.in_fifo_w_en.eq(1),
                 ]
-                m.next = "ADDRESS PERIPHERAL: LATCHED W_EN"
+                m.next = "START: ADDRESSED OFFSET[1]"
 
-            with m.State("ADDRESS PERIPHERAL: LATCHED W_EN"):
+            with m.State("START: ADDRESSED OFFSET[1]"):
+                m.d.sync += self.rom_bus.addr.eq(self.rom_bus.addr + 1)
+                m.d.comb += self.i2c_bus.stb.eq(1)
+                m.next = "START: ADDRESSED LEN[0], OFFSET[0] AVAILABLE"
+
+            with m.State("START: ADDRESSED LEN[0], OFFSET[0] AVAILABLE"):
                 m.d.sync += [
-                    self.i2c_bus.in_fifo_w_en.eq(0),
-                    self.i2c_bus.stb.eq(1),
+                    self.rom_bus.addr.eq(self.rom_bus.addr + 1),
+                    self._offset.eq(self.rom_bus.data),
                 ]
+                m.next = "START: ADDRESSED LEN[1], OFFSET[1] AVAILABLE"
+
+            with m.State("START: ADDRESSED LEN[1], OFFSET[1] AVAILABLE"):
+                # From here on, rom_bus.addr is the only read pointer; _offset
+                # only ever holds OFFSET[0].
+                m.d.sync += self.rom_bus.addr.eq(Cat(self._offset, self.rom_bus.data))
+                m.next = "START: ADDRESSED *OFFSET, LEN[0] AVAILABLE"
+
+            with m.State("START: ADDRESSED *OFFSET, LEN[0] AVAILABLE"):
+                m.d.sync += self._remain.eq(self.rom_bus.data)
+                m.next = "START: LEN[1] AVAILABLE"
+
+            with m.State("START: LEN[1] AVAILABLE"):
+                m.d.sync += self._remain.eq(Cat(self._remain[:8], self.rom_bus.data))
                 m.next = "LOOP HEAD: SEQ BREAK OR WAIT I2C"
 
             with m.State("LOOP HEAD: SEQ BREAK OR WAIT I2C"):
-                m.d.sync += self.i2c_bus.stb.eq(0)
                 with m.If(self._remain == 0):
-                    m.d.sync += [
-                        self.rom_bus.addr.eq(self._offset + 1),
-                        self._offset.eq(self._offset + 1),
-                    ]
-                    m.next = "SEQ BREAK: ADDRESSED NEXTLEN[1], NEXTLEN[0] AVAILABLE"
+                    m.d.sync += self.rom_bus.addr.eq(self.rom_bus.addr + 1)
+                    m.next = "SEQ BREAK: ADDRESSED NEXTLEN[1]"
                 with m.Elif(self.i2c_bus.in_fifo_w_rdy):
-                    m.d.sync += [
-                        self._offset.eq(self._offset + 1),
-                        self._remain.eq(self._remain - 1),
-                        transfer.kind.eq(Transfer.Kind.DATA),
+                    m.d.comb += [
                         transfer.payload.data.eq(self.rom_bus.data),
                         self.i2c_bus.in_fifo_w_en.eq(1),
                     ]
+                    m.d.sync += self._remain.eq(self._remain - 1)
 
                     # Prepare next read, whether it's data or NEXTLEN[0].
-                    m.d.sync += self.rom_bus.addr.eq(self._offset + 1)
-                    m.next = "SEND: LATCHED W_EN"
-
-            with m.State("SEND: LATCHED W_EN"):
-                m.d.sync += self.i2c_bus.in_fifo_w_en.eq(0)
-                m.next = "SEND: WAIT FOR I2C"
+                    m.d.sync += self.rom_bus.addr.eq(self.rom_bus.addr + 1)
+                    with m.If(self._remain == 1):
+                        # Fetch the rest of the next header while the I2C is
+                        # busy with this byte.
+                        m.next = "SEQ BREAK: ADDRESSED NEXTLEN[0]"
+                    with m.Else():
+                        m.next = "SEND: WAIT FOR I2C"
 
             with m.State("SEND: WAIT FOR I2C"):
                 with m.If(
@@ -118,35 +110,41 @@ class ROMWriter(Component):
                 ):
                     m.next = "LOOP HEAD: SEQ BREAK OR WAIT I2C"
                 with m.Elif(~self.i2c_bus.busy):
-                    # Failed.  Stop.
-                    m.d.sync += self.busy.eq(0)
-                    m.next = "IDLE"
+                    m.next = "ABORT"
 
-            with m.State("SEQ BREAK: ADDRESSED NEXTLEN[1], NEXTLEN[0] AVAILABLE"):
-                m.d.sync += [
-                    self._remain.eq(self.rom_bus.data),
-                    self.rom_bus.addr.eq(self._offset + 1),
-                    self._offset.eq(self._offset + 1),
-                ]
-                m.next = "SEQ BREAK: ADDRESSED FOLLOWING, NEXTLEN[1] AVAILABLE"
+            with m.State("SEQ BREAK: ADDRESSED NEXTLEN[0]"):
+                m.d.sync += self.rom_bus.addr.eq(self.rom_bus.addr + 1)
+                m.next = "SEQ BREAK: ADDRESSED NEXTLEN[1]"
+
+            with m.State("SEQ BREAK: ADDRESSED NEXTLEN[1]"):
+                m.d.sync += self.rom_bus.addr.eq(self.rom_bus.addr + 1)
+                m.next = "SEQ BREAK: ADDRESSED FOLLOWING, NEXTLEN[0] AVAILABLE"
 
-            with m.State("SEQ BREAK: ADDRESSED FOLLOWING, NEXTLEN[1] AVAILABLE"):
-                _remain = self._remain | cast(Cat, self.rom_bus.data.shift_left(8))
+            with m.State("SEQ BREAK: ADDRESSED FOLLOWING, NEXTLEN[0] AVAILABLE"):
+                m.d.sync += self._remain.eq(self.rom_bus.data)
+                m.next = "SEQ BREAK: NEXTLEN[1] AVAILABLE"
+
+            with m.State("SEQ BREAK: NEXTLEN[1] AVAILABLE"):
+                _remain = Cat(self._remain[:8], self.rom_bus.data)
+                m.d.sync += self._remain.eq(_remain)
                 with m.If(_remain == 0):
                     m.next = "FIN: WAIT I2C DONE"
                 with m.Else():
-                    m.d.sync += [
-                        self._remain.eq(_remain),
+                    m.next = "SEQ BREAK: WAIT FOR I2C"
+
+            with m.State("SEQ BREAK: WAIT FOR I2C"):
+                with m.If(
+                    self.i2c_bus.busy & self.i2c_bus.ack & self.i2c_bus.in_fifo_w_rdy
+                ):
+                    m.d.comb += [
                         transfer.kind.eq(Transfer.Kind.START),
                         transfer.payload.start.addr.eq(self._addr),
                         transfer.payload.start.rw.eq(RW.W),
                         self.i2c_bus.in_fifo_w_en.eq(1),
                     ]
-                    m.next = "SEQ BREAK: LATCHED W_EN"
-
-            with m.State("SEQ BREAK: LATCHED W_EN"):
-                m.d.sync += self.i2c_bus.in_fifo_w_en.eq(0)
-                m.next = "LOOP HEAD: SEQ BREAK OR WAIT I2C"
+                    m.next = "LOOP HEAD: SEQ BREAK OR WAIT I2C"
+                with m.Elif(~self.i2c_bus.busy):
+                    m.next = "ABORT"
 
             with m.State("FIN: WAIT I2C DONE"):
                 with m.If(
@@ -155,7 +153,13 @@ class ROMWriter(Component):
                     m.d.sync += self.busy.eq(0)
                     m.next = "IDLE"
                 with m.Elif(~self.i2c_bus.busy):
-                    m.d.sync += self.busy.eq(0)
-                    m.next = "IDLE"
+                    m.next = "ABORT"
+
+            with m.State("ABORT"):
+                m.d.sync += self.busy.eq(0)
+                m.next = "IDLE"
+
+        # See Clser.
+        fsm.state.attrs["fsm_encoding"] = "one-hot"
 
         return m
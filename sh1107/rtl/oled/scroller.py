@@ -54,23 +54,26 @@ class Scroller(Component):
 
             with m.State("START: ADDRESSED OFFSET[0]"):
                 m.d.sync += self.rom_bus.addr.eq(self.rom_bus.addr + 1)
-                m.next = "START: ADDRESSED OFFSET[1], OFFSET[0] AVAILABLE"
+                m.next = "START: ADDRESSED OFFSET[1]"
 
-            with m.State("START: ADDRESSED OFFSET[1], OFFSET[0] AVAILABLE"):
+            with m.State("START: ADDRESSED OFFSET[1]"):
+                m.d.sync += self.rom_bus.addr.eq(self.rom_bus.addr + 1)
+                m.next = "START: ADDRESSED LEN[0], OFFSET[0] AVAILABLE"
+
+            with m.State("START: ADDRESSED LEN[0], OFFSET[0] AVAILABLE"):
                 m.d.sync += [
                     self.rom_bus.addr.eq(self.rom_bus.addr + 1),
                     self._offset.eq(self.rom_bus.data),
                 ]
-                m.next = "START: ADDRESSED LEN[0], OFFSET[1] AVAILABLE"
+                m.next = "START: ADDRESSED LEN[1], OFFSET[1] AVAILABLE"
 
-            with m.State("START: ADDRESSED LEN[0], OFFSET[1] AVAILABLE"):
-                m.d.sync += [
-                    self.rom_bus.addr.eq(self.rom_bus.addr + 1),
-                    self._offset.eq(self._offset | self.rom_bus.data.shift_left(8)),
-                ]
-                m.next = "START: ADDRESSED LEN[1], LEN[0] AVAILABLE"
+            with m.State("START: ADDRESSED LEN[1], OFFSET[1] AVAILABLE"):
+                m.d.sync += self._offset.eq(
+                    self._offset | self.rom_bus.data.shift_left(8)
+                )
+                m.next = "START: LEN[0] AVAILABLE"
 
-            with m.State("START: ADDRESSED LEN[1], LEN[0] AVAILABLE"):
+            with m.State("START: LEN[0] AVAILABLE"):
                 m.d.sync += [
                     self._remain.eq(self.rom_bus.data),
                     self.rom_bus.addr.eq(self._offset),
@@ -101,7 +104,7 @@ class Scroller(Component):
                         self.rom_bus.addr.eq(self._offset + 1),
                         self._offset.eq(self._offset + 1),
                     ]
-                    m.next = "SEQ BREAK: ADDRESSED NEXTLEN[1], NEXTLEN[0] AVAILABLE"
+                    m.next = "SEQ BREAK: ADDRESSED NEXTLEN[1]"
                 with m.Elif(self.i2c_bus.in_fifo_w_rdy):
                     m.d.sync += [
                         self._offset.eq(self._offset + 1),
@@ -141,7 +144,17 @@ class Scroller(Component):
 
             with m.State("SEND: LATCHED W_EN"):
                 m.d.sync += self.i2c_bus.in_fifo_w_en.eq(0)
-                m.next = "SEND: WAIT FOR I2C"
+                with m.If(self._remain == 0):
+                    # NEXTLEN[0] is already addressed; fetch the rest of the
+                    # next header while the I2C is busy with this byte, since
+                    # ROM reads take two cycles.
+                    m.d.sync += [
+                        self.rom_bus.addr.eq(self._offset + 1),
+                        self._offset.eq(self._offset + 1),
+                    ]
+                    m.next = "SEQ BREAK: ADDRESSED NEXTLEN[1]"
+                with m.Else():
+                    m.next = "SEND: WAIT FOR I2C"
 
             with m.State("SEND: WAIT FOR I2C"):
                 with m.If(
@@ -153,27 +166,40 @@ class Scroller(Component):
                     m.d.sync += self.busy.eq(0)
                     m.next = "IDLE"
 
-            with m.State("SEQ BREAK: ADDRESSED NEXTLEN[1], NEXTLEN[0] AVAILABLE"):
+            with m.State("SEQ BREAK: ADDRESSED NEXTLEN[1]"):
                 m.d.sync += [
-                    self._remain.eq(self.rom_bus.data),
                     self.rom_bus.addr.eq(self._offset + 1),
                     self._offset.eq(self._offset + 1),
                 ]
-                m.next = "SEQ BREAK: ADDRESSED FOLLOWING, NEXTLEN[1] AVAILABLE"
+                m.next = "SEQ BREAK: ADDRESSED FOLLOWING, NEXTLEN[0] AVAILABLE"
+
+            with m.State("SEQ BREAK: ADDRESSED FOLLOWING, NEXTLEN[0] AVAILABLE"):
+                m.d.sync += self._remain.eq(self.rom_bus.data)
+                m.next = "SEQ BREAK: NEXTLEN[1] AVAILABLE"
 
-            with m.State("SEQ BREAK: ADDRESSED FOLLOWING, NEXTLEN[1] AVAILABLE"):
+            with m.State("SEQ BREAK: NEXTLEN[1] AVAILABLE"):
                 _remain = self._remain | cast(Cat, self.rom_bus.data.shift_left(8))
+                m.d.sync += self._remain.eq(_remain)
                 with m.If(_remain == 0):
                     m.next = "FIN: WAIT I2C DONE"
                 with m.Else():
+                    m.next = "SEQ BREAK: WAIT FOR I2C"
+
+            with m.State("SEQ BREAK: WAIT FOR I2C"):
+                with m.If(
+                    self.i2c_bus.busy & self.i2c_bus.ack & self.i2c_bus.in_fifo_w_rdy
+                ):
                     m.d.sync += [
-                        self._remain.eq(_remain),
                         transfer.kind.eq(Transfer.Kind.START),
                         transfer.payload.start.addr.eq(self._addr),
                         transfer.payload.start.rw.eq(RW.W),
                         self.i2c_bus.in_fifo_w_en.eq(1),
                     ]
                     m.next = "SEQ BREAK: LATCHED W_EN"
+                with m.Elif(~self.i2c_bus.busy):
+                    # Failed.  Stop.
+                    m.d.sync += self.busy.eq(0)
+                    m.next = "IDLE"
 
             with m.State("SEQ BREAK: LATCHED W_EN"):
                 m.d.sync += self.i2c_bus.in_fifo_w_en.eq(0)
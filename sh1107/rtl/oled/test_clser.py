@@ -1,11 +1,11 @@
-from typing import Final, Optional
+from typing import Final
 
 from amaranth import Elaboratable, Module
-from amaranth.build import Platform
 from amaranth.lib.wiring import connect
 from amaranth.sim import Delay
 
 from ... import sim
+from ...platform import Platform
 from ..common import Hz
 from ..i2c import I2C, sim_i2c
 from .clser import Clser
@@ -19,13 +19,13 @@ class TestClserTop(Elaboratable):
     i2c: I2C
     clser: Clser
 
-    def __init__(self, *, speed: Hz):
+    def __init__(self, *, speed: Hz, cols: int = 128, pages: int = 16):
         self.speed = speed
 
         self.i2c = I2C(speed=speed)
-        self.clser = Clser(addr=TestClserTop.ADDR)
+        self.clser = Clser(addr=TestClserTop.ADDR, cols=cols, pages=pages)
 
-    def elaborate(self, platform: Optional[Platform]) -> Elaboratable:
+    def elaborate(self, platform: Platform) -> Elaboratable:
         m = Module()
 
         m.submodules.i2c = self.i2c
@@ -51,19 +51,19 @@ class TestClser(sim.TestCase):
             trigger,
             [
                 0x17A,
+                0x80,
                 0x00,
-                0x00,
+                0x80,
                 0x10,
+                0x80,
                 0xB0,
-                0x17A,
                 0x40,
                 [0x00 for _ in range(128)],
                 *[
                     [
                         0x17A,
-                        0x00,
+                        0x80,
                         0xB0 + page,
-                        0x17A,
                         0x40,
                         *[0x00 for _ in range(128)],
                     ]
@@ -72,3 +72,41 @@ class TestClser(sim.TestCase):
             ],
             test_nacks=False,
         )
+
+    @sim.args(speed=Hz(2_000_000), cols=64, pages=8)
+    def test_sim_clser_small(self, dut: TestClserTop) -> sim.Procedure:
+        def trigger() -> sim.Procedure:
+            yield dut.clser.stb.eq(1)
+            yield Delay(sim.clock())
+            yield dut.clser.stb.eq(0)
+
+        yield from sim_i2c.full_sequence(
+            dut.i2c,
+            trigger,
+            [
+                0x17A,
+                0x80,
+                0x00,
+                0x80,
+                0x10,
+                0x80,
+                0xB0,
+                0x40,
+                [0x00 for _ in range(64)],
+                *[
+                    [
+                        0x17A,
+                        0x80,
+                        0x00,
+                        0x80,
+                        0x10,
+                        0x80,
+                        0xB0 + page,
+                        0x40,
+                        *[0x00 for _ in range(64)],
+                    ]
+                    for page in range(1, 8)
+                ],
+            ],
+            test_nacks=False,
+        )
@@ -37,62 +37,22 @@ class TestLocatorTop(Elaboratable):
 
 
 class TestLocator(sim.TestCase):
+    # See TestROMWriter.
     @sim.i2c_speeds
     def test_sim_locator(self, dut: TestLocatorTop) -> sim.Procedure:
-        def trigger() -> sim.Procedure:
-            yield dut.locator.row.eq(16)
-            yield dut.locator.col.eq(8)
-            yield dut.locator.stb.eq(1)
-            yield Tick()
-            yield dut.locator.stb.eq(0)
-
-        yield from sim_i2c.full_sequence(
-            dut.i2c,
-            trigger,
-            [
-                0x17A,
-                0x00,
-                0xB8,
-                0x08,
-                0x17,
-            ],
-        )
-
-    @sim.i2c_speeds
-    def test_sim_locator_row_only(self, dut: TestLocatorTop) -> sim.Procedure:
-        def trigger() -> sim.Procedure:
-            yield dut.locator.row.eq(7)
-            yield dut.locator.col.eq(0)
-            yield dut.locator.stb.eq(1)
-            yield Tick()
-            yield dut.locator.stb.eq(0)
-
-        yield from sim_i2c.full_sequence(
-            dut.i2c,
-            trigger,
-            [
-                0x17A,
-                0x00,
-                0x00,
-                0x13,
-            ],
-        )
-
-    @sim.i2c_speeds
-    def test_sim_locator_col_only(self, dut: TestLocatorTop) -> sim.Procedure:
-        def trigger() -> sim.Procedure:
-            yield dut.locator.row.eq(0)
-            yield dut.locator.col.eq(13)
-            yield dut.locator.stb.eq(1)
-            yield Tick()
-            yield dut.locator.stb.eq(0)
-
-        yield from sim_i2c.full_sequence(
-            dut.i2c,
-            trigger,
-            [
-                0x17A,
-                0x00,
-                0xB3,
-            ],
-        )
+        for row, col, sequence in [
+            (16, 8, [0x17A, 0x00, 0xB8, 0x08, 0x17]),
+            # Row only.
+            (7, 0, [0x17A, 0x00, 0x00, 0x13]),
+            # Column only.
+            (0, 13, [0x17A, 0x00, 0xB3]),
+        ]:
+
+            def trigger(row: int = row, col: int = col) -> sim.Procedure:
+                yield dut.locator.row.eq(row)
+                yield dut.locator.col.eq(col)
+                yield dut.locator.stb.eq(1)
+                yield Tick()
+                yield dut.locator.stb.eq(0)
+
+            yield from sim_i2c.full_sequence(dut.i2c, trigger, sequence)
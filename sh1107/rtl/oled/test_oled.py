@@ -0,0 +1,339 @@
+import struct
+from typing import Final
+
+from amaranth import Elaboratable, Memory, Module, Signal
+from amaranth.lib.wiring import Component, In
+from amaranth.sim import Tick
+
+from ... import rom, sim
+from ...platform import Platform
+from ..common import Hz
+from ..i2c import I2C
+from ..spi import SPIFlashReaderBus
+from . import OLED
+
+
+class MockSPIFlashReader(Component):
+    """
+    Stands in for the SPIFlashReader with the ROM already in flash, serving a
+    word every other cycle from wherever it's asked to start.
+    """
+
+    _data: bytes
+    bus: In(SPIFlashReaderBus(16))
+
+    def __init__(self, *, data: bytes):
+        super().__init__()
+        self._data = data
+
+    def elaborate(self, platform: Platform) -> Elaboratable:
+        m = Module()
+
+        # The offset is ignored: the OLED only ever reads from flash_rom_base.
+        words = list(struct.unpack(f"<{len(self._data) // 2}H", self._data))
+        m.submodules.rd = rd = Memory(
+            width=16, depth=len(words), init=words
+        ).read_port()
+
+        # Like the real SPIFR, addr and len are only looked at the cycle after
+        # stb, which is also when busy rises.
+        started = Signal()
+        remaining = Signal.like(self.bus.len)
+
+        m.d.comb += [
+            self.bus.busy.eq(started | (remaining != 0)),
+            self.bus.data.eq(rd.data),
+        ]
+        m.d.sync += [
+            started.eq(self.bus.stb),
+            self.bus.valid.eq(0),
+        ]
+
+        with m.If(self.bus.stb):
+            m.d.sync += rd.addr.eq(0)
+        with m.Elif(started):
+            m.d.sync += remaining.eq(self.bus.len)
+        with m.Elif((remaining != 0) & ~self.bus.valid):
+            m.d.sync += [
+                rd.addr.eq(rd.addr + 1),
+                remaining.eq(remaining - 1),
+                self.bus.valid.eq(1),
+            ]
+
+        return m
+
+
+class TestOLEDTop(Elaboratable):
+    speed: Hz
+
+    oled: OLED
+
+    def __init__(self, *, platform: Platform, speed: Hz, spi_test: bool = True):
+        self.speed = speed
+
+        self.oled = OLED(platform=platform, speed=speed, spi_test=spi_test)
+        # The test platform has no flash behind the SPIFR.
+        self.oled._spifr = MockSPIFlashReader(data=rom.ROM_CONTENT)
+
+    def elaborate(self, platform: Platform) -> Elaboratable:
+        m = Module()
+
+        m.submodules.oled = self.oled
+
+        return m
+
+
+class I2CMonitor:
+    """
+    Follows the OLED's I2C lines cycle by cycle as the SH1107 would, ACKing
+    everything written to it and answering reads with read_byte.
+
+    Each transaction is recorded as the bytes written, with START and repeated
+    START addresses marked by 0x100, as in sim_i2c.full_sequence.
+    """
+
+    i2c: I2C
+    read_byte: int
+    transactions: list[list[int]]
+
+    def __init__(self, i2c: I2C, *, read_byte: int = 0x00):
+        self.i2c = i2c
+        self.read_byte = read_byte
+        self.transactions = []
+
+        self._scl = 1
+        self._sda = 1
+        self._current: list[int] | None = None
+        self._bit = 0
+        self._byte = 0
+        self._addressing = False
+        self._reading = False
+        self._sda_i = 1
+
+    def step(self) -> sim.Procedure:
+        hw_bus = self.i2c.hw_bus
+
+        scl = yield hw_bus.scl_o
+        if (yield hw_bus.sda_oe):
+            sda = yield hw_bus.sda_o
+        else:
+            sda = self._sda_i
+
+        if self._scl and scl and self._sda != sda:
+            if not sda:
+                # START or repeated START.
+                if self._current is None:
+                    self._current = []
+                self._bit = 0
+                self._byte = 0
+                self._addressing = True
+                self._reading = False
+            else:
+                # STOP.
+                assert self._current is not None
+                self.transactions.append(self._current)
+                self._current = None
+
+        elif not self._scl and scl and self._current is not None:
+            # Count bits as SCL rises, and act on them as it falls again.
+            if self._bit < 8 and not self._reading:
+                self._byte = (self._byte << 1) | sda
+            self._bit += 1
+
+        elif self._scl and not scl and self._current is not None:
+            if self._bit == 8:
+                if self._reading:
+                    # Let the controller ACK or NACK.
+                    self._sda_i = 1
+                else:
+                    if self._addressing:
+                        self._current.append(0x100 | self._byte)
+                    else:
+                        self._current.append(self._byte)
+                    self._sda_i = 0
+            elif self._bit == 9:
+                if not self._reading:
+                    self._reading = self._addressing and bool(self._byte & 1)
+                self._bit = 0
+                self._byte = 0
+                self._addressing = False
+                self._sda_i = self._read_bit(0) if self._reading else 1
+            elif self._reading:
+                self._sda_i = self._read_bit(self._bit)
+
+        yield hw_bus.sda_i.eq(self._sda_i)
+        self._scl = scl
+        self._sda = sda
+
+    def _read_bit(self, bit: int) -> int:
+        return (self.read_byte >> (7 - bit)) & 1
+
+
+def rom_sequence(index: int) -> list[int]:
+    # See the ROM structure notes in rom.
+    offset, length = struct.unpack_from("<HH", rom.ROM_CONTENT, index * 4)
+    sequence = []
+    while length:
+        sequence += [
+            0x100 | (OLED.ADDR << 1),
+            *rom.ROM_CONTENT[offset : offset + length],
+        ]
+        offset += length
+        (length,) = struct.unpack_from("<H", rom.ROM_CONTENT, offset)
+        offset += 2
+    return sequence
+
+
+def char_sequence(char: str) -> list[int]:
+    return rom_sequence(rom.OFFSET_CHAR + ord(char))
+
+
+def locate_sequence(row: int, col: int) -> list[int]:
+    # See Locator; text columns are pages, counted down from the right.
+    column = (row - 1) * 8
+    return [
+        0x100 | (OLED.ADDR << 1),
+        0x00,
+        0xB0 | (16 - col),
+        column & 0xF,
+        0x10 | (column >> 4),
+    ]
+
+
+class TestOLED(sim.TestCase):
+    ADDR_W: Final[int] = 0x100 | (OLED.ADDR << 1)
+
+    def _cycle(self, monitor: I2CMonitor) -> sim.Procedure:
+        yield from monitor.step()
+        yield Tick()
+
+    def _wait_ready(self, dut: TestOLEDTop, monitor: I2CMonitor) -> sim.Procedure:
+        # Nothing goes out until the ROM's loaded far enough for INIT.
+        while (yield dut.oled.result) == OLED.Result.BUSY:
+            yield from self._cycle(monitor)
+        assert (yield dut.oled.result) == OLED.Result.SUCCESS
+        assert monitor.transactions == []
+
+    def _command(
+        self, dut: TestOLEDTop, monitor: I2CMonitor, data: list[int]
+    ) -> sim.Generator[OLED.Result]:
+        fifo_in = dut.oled.fifo_in
+        for byte in data:
+            while not (yield fifo_in.w_rdy):
+                yield from self._cycle(monitor)
+            yield fifo_in.w_data.eq(byte)
+            yield fifo_in.w_en.eq(1)
+            yield from self._cycle(monitor)
+        yield fifo_in.w_en.eq(0)
+
+        while (yield dut.oled.result) != OLED.Result.BUSY:
+            yield from self._cycle(monitor)
+        while (yield dut.oled.result) == OLED.Result.BUSY:
+            yield from self._cycle(monitor)
+        result = OLED.Result((yield dut.oled.result))
+
+        # Let the last transaction finish on the wire.
+        while (yield dut.oled.i2c_bus.busy):
+            yield from self._cycle(monitor)
+        for _ in range(10):
+            yield from self._cycle(monitor)
+
+        return result
+
+    @sim.args(speed=Hz(OLED.DEFAULT_SPEED))
+    def test_sim_oled(self, dut: TestOLEDTop) -> sim.Procedure:
+        monitor = I2CMonitor(dut.oled._i2c, read_byte=0x43)
+
+        yield from self._wait_ready(dut, monitor)
+
+        for data, expected in [
+            (
+                [OLED.Command.INIT],
+                [rom_sequence(rom.OFFSET_INIT)],
+            ),
+            (
+                [OLED.Command.PRINT, 2, ord("H"), ord("i")],
+                [
+                    char_sequence("H"),
+                    [self.ADDR_W, 0x00, 0xBE, 0x00, 0x10],
+                    char_sequence("i"),
+                    [self.ADDR_W, 0x00, 0xBD, 0x00, 0x10],
+                ],
+            ),
+            (
+                [OLED.Command.LOCATE, 16, 8],
+                [[self.ADDR_W, 0x00, 0xB8, 0x08, 0x17]],
+            ),
+            (
+                [OLED.Command.PRINT_BYTE, 0xA7],
+                [
+                    char_sequence("A"),
+                    [self.ADDR_W, 0x00, 0xB7, 0x08, 0x17],
+                    char_sequence("7"),
+                    [self.ADDR_W, 0x00, 0xB6, 0x08, 0x17],
+                ],
+            ),
+            (
+                [OLED.Command.ID],
+                [
+                    [self.ADDR_W, 0x00, self.ADDR_W | 1],
+                    char_sequence("4"),
+                    [self.ADDR_W, 0x00, 0xB5, 0x08, 0x17],
+                    char_sequence("3"),
+                    [self.ADDR_W, 0x00, 0xB4, 0x08, 0x17],
+                ],
+            ),
+        ]:
+            result = yield from self._command(dut, monitor, data)
+            assert result == OLED.Result.SUCCESS, f"{data}: got {result!r}"
+            assert (
+                monitor.transactions == expected
+            ), f"{data}: expected {expected}, got {monitor.transactions}"
+            monitor.transactions = []
+
+    @sim.args(speed=Hz(OLED.DEFAULT_SPEED), spi_test=False)
+    def test_sim_oled_no_spi_test(self, dut: TestOLEDTop) -> sim.Procedure:
+        monitor = I2CMonitor(dut.oled._i2c)
+        yield from self._wait_ready(dut, monitor)
+
+        # SPI_TEST fails without touching the bus, and hex printing still
+        # finishes its command.
+        for data, expected_result, expected in [
+            ([OLED.Command.SPI_TEST], OLED.Result.FAILURE, []),
+            (
+                [OLED.Command.PRINT_BYTE, 0x5C],
+                OLED.Result.SUCCESS,
+                [
+                    char_sequence("5"),
+                    [self.ADDR_W, 0x00, 0xBE, 0x00, 0x10],
+                    char_sequence("C"),
+                    [self.ADDR_W, 0x00, 0xBD, 0x00, 0x10],
+                ],
+            ),
+        ]:
+            result = yield from self._command(dut, monitor, data)
+            assert result == expected_result, f"{data}: got {result!r}"
+            assert (
+                monitor.transactions == expected
+            ), f"{data}: expected {expected}, got {monitor.transactions}"
+            monitor.transactions = []
+
+    # 64 characters go out; run the bus at vsh's speed to keep this quick.
+    @sim.args(speed=Hz(OLED.DEFAULT_SPEED_VSH))
+    def test_sim_oled_spi_test(self, dut: TestOLEDTop) -> sim.Procedure:
+        monitor = I2CMonitor(dut.oled._i2c)
+        yield from self._wait_ready(dut, monitor)
+
+        # SPI_TEST prints the start of flash, each character followed by a
+        # locate to the next position.
+        expected = []
+        row, col = 1, 1
+        for char in rom.ROM_CONTENT[:0x20].hex().upper():
+            row, col = (row + 1, 1) if col == 16 else (row, col + 1)
+            expected += [char_sequence(char), locate_sequence(row, col)]
+
+        result = yield from self._command(dut, monitor, [OLED.Command.SPI_TEST])
+        assert result == OLED.Result.SUCCESS, f"got {result!r}"
+        assert (
+            monitor.transactions == expected
+        ), f"expected {expected}, got {monitor.transactions}"
@@ -47,47 +47,41 @@ class TestROMWriterTop(Elaboratable):
 
 
 class TestROMWriter(sim.TestCase):
+    # The scenarios run back to back in one simulation per speed, rather than
+    # elaborating and building a simulator for each.
     @sim.i2c_speeds
-    def test_sim_rom_writer_dispoff(self, dut: TestROMWriterTop) -> sim.Procedure:
-        def trigger() -> sim.Procedure:
-            assert not (yield dut.rom_writer.busy)
-            yield dut.rom_writer.index.eq(rom.OFFSET_DISPLAY_OFF)
-            yield dut.rom_writer.stb.eq(1)
-            yield Delay(sim.clock())
-            yield dut.rom_writer.stb.eq(0)
-
-        yield from sim_i2c.full_sequence(
-            dut.i2c,
-            trigger,
-            [
-                0x17A,
-                0x00,
-                0xAE,
-            ],
-        )
-
-    @sim.i2c_speeds
-    def test_sim_rom_writer_chara(self, dut: TestROMWriterTop) -> sim.Procedure:
-        def trigger() -> sim.Procedure:
-            assert not (yield dut.rom_writer.busy)
-            yield dut.rom_writer.index.eq(rom.OFFSET_CHAR + 0x41)
-            yield dut.rom_writer.stb.eq(1)
-            yield Delay(sim.clock())
-            yield dut.rom_writer.stb.eq(0)
-
-        yield from sim_i2c.full_sequence(
-            dut.i2c,
-            trigger,
-            [
-                0x17A,
-                0x40,
-                0b00110000,
-                0b01111000,
-                0b11001100,
-                0b11001100,
-                0b11111100,
-                0b11001100,
-                0b11001100,
-                0b00000000,
-            ],
-        )
+    def test_sim_rom_writer(self, dut: TestROMWriterTop) -> sim.Procedure:
+        for index, sequence in [
+            (
+                rom.OFFSET_DISPLAY_OFF,
+                [
+                    0x17A,
+                    0x00,
+                    0xAE,
+                ],
+            ),
+            (
+                rom.OFFSET_CHAR + 0x41,
+                [
+                    0x17A,
+                    0x40,
+                    0b00110000,
+                    0b01111000,
+                    0b11001100,
+                    0b11001100,
+                    0b11111100,
+                    0b11001100,
+                    0b11001100,
+                    0b00000000,
+                ],
+            ),
+        ]:
+
+            def trigger(index: int = index) -> sim.Procedure:
+                assert not (yield dut.rom_writer.busy)
+                yield dut.rom_writer.index.eq(index)
+                yield dut.rom_writer.stb.eq(1)
+                yield Delay(sim.clock())
+                yield dut.rom_writer.stb.eq(0)
+
+            yield from sim_i2c.full_sequence(dut.i2c, trigger, sequence)
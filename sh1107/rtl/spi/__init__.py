@@ -21,21 +21,40 @@ SPIHardwareBus = Signature(
 )
 
 
-SPIFlashReaderBus = Signature(
-    {
-        "addr": Out(24),
-        "len": Out(16),
-        "stb": Out(1),
-        "busy": In(1),
-        "data": In(8),
-        "valid": In(1),
-    }
-)
+class SPIFlashReaderBus(Signature):
+    """
+    Bus for SPIFlashReader.
+
+    len is counted in data beats, not bytes.  Each beat is data_width bits wide
+    and carries consecutive bytes from flash in little-endian order, i.e. the
+    first byte read is in data[:8].
+    """
+
+    def __init__(self, data_width: int = 8):
+        assert data_width in (8, 16, 24, 32)
+        super().__init__(
+            {
+                "addr": Out(24),
+                "len": Out(16),
+                "stb": Out(1),
+                "busy": In(1),
+                "data": In(data_width),
+                "valid": In(1),
+            }
+        )
 
 
 class SPIFlashReader(Component):
-    spi: Out(SPIHardwareBus)
-    bus: In(SPIFlashReaderBus)
+    _data_width: int
+
+    def __init__(self, *, data_width: int = 8):
+        self._data_width = data_width
+        super().__init__(
+            {
+                "spi": Out(SPIHardwareBus),
+                "bus": In(SPIFlashReaderBus(data_width)),
+            }
+        )
 
     def elaborate(self, platform: Platform) -> Elaboratable:
         m = Module()
@@ -102,13 +121,20 @@ class SPIFlashReader(Component):
         sr = Signal(32)
         snd_bitcount = Signal(range(max(32, TRES1_TDP_CYCLES)))
 
-        rcv_bitcount = Signal(range(8))
-        rcv_bytecount = Signal.like(self.bus.len)
+        rcv_bitcount = Signal(range(self._data_width))
+        rcv_beatcount = Signal.like(self.bus.len)
 
         m.d.comb += [
             self.spi.copi.eq(sr[-1]),
             self.spi.clk.eq(self.spi.cs & ~clk),
-            self.bus.data.eq(sr[:8]),
+            # Bytes are shifted in MSB first, so the first byte of the beat is
+            # the most significant in sr.
+            self.bus.data.eq(
+                Cat(
+                    sr[i * 8 : (i + 1) * 8]
+                    for i in reversed(range(self._data_width // 8))
+                )
+            ),
         ]
 
         m.d.sync += self.bus.valid.eq(0)
@@ -145,8 +171,8 @@ class SPIFlashReader(Component):
                         self.spi.cs.eq(1),
                         sr.eq(Cat(self.bus.addr, C(0x03, 8))),
                         snd_bitcount.eq(31),
-                        rcv_bitcount.eq(7),
-                        rcv_bytecount.eq(self.bus.len - 1),
+                        rcv_bitcount.eq(self._data_width - 1),
+                        rcv_beatcount.eq(self.bus.len - 1),
                     ]
                     m.next = "SEND CMD"
 
@@ -165,11 +191,11 @@ class SPIFlashReader(Component):
                 ]
                 with m.If(rcv_bitcount == 0):
                     m.d.sync += [
-                        rcv_bytecount.eq(rcv_bytecount - 1),
-                        rcv_bitcount.eq(7),
+                        rcv_beatcount.eq(rcv_beatcount - 1),
+                        rcv_bitcount.eq(self._data_width - 1),
                         self.bus.valid.eq(1),
                     ]
-                    with m.If(rcv_bytecount == 0):
+                    with m.If(rcv_beatcount == 0):
                         m.d.sync += [
                             self.spi.cs.eq(0),
                             snd_bitcount.eq(TRES1_TDP_CYCLES - 1),
@@ -90,15 +90,15 @@ class TestSPIFlashReaderTop(Component):
     _spifr: SPIFlashReader
     _peripheral: MockSPIFlashPeripheral
 
-    def __init__(self, *, data: ValueCastable):
+    def __init__(self, *, data: ValueCastable, data_width: int = 8):
         super().__init__()
 
         self._data = Value.cast(data)
-        self._len = len(self._data) // 8
+        self._len = len(self._data) // data_width
 
-        self._fifo_out = SyncFIFO(width=8, depth=self._len)
+        self._fifo_out = SyncFIFO(width=data_width, depth=self._len)
 
-        self._spifr = SPIFlashReader()
+        self._spifr = SPIFlashReader(data_width=data_width)
         self._peripheral = MockSPIFlashPeripheral(data=self._data)
 
     def elaborate(self, platform: Platform) -> Elaboratable:
@@ -115,25 +115,22 @@ class TestSPIFlashReaderTop(Component):
             self._peripheral.spi.clk.eq(self._spifr.spi.clk),
         ]
 
-        m.d.sync += [
-            self._spifr.bus.stb.eq(0),
-            self._fifo_out.w_en.eq(0),
-        ]
+        m.d.sync += self._fifo_out.w_en.eq(0)
 
         with m.FSM() as fsm:
             m.d.comb += self.busy.eq(~fsm.ongoing("IDLE"))
 
             with m.State("IDLE"):
                 with m.If(self.stb):
+                    # The SPIFR latches addr and len well after it's strobed,
+                    # so they can follow a cycle behind; strobing it
+                    # combinatorially means it's busy by WAITING SPIFR.
+                    m.d.comb += self._spifr.bus.stb.eq(1)
                     m.d.sync += [
                         self._spifr.bus.addr.eq(0x00CAFE),
                         self._spifr.bus.len.eq(self._len),
-                        self._spifr.bus.stb.eq(1),
                     ]
-                    m.next = "STROBED SPIFR"
-
-            with m.State("STROBED SPIFR"):
-                m.next = "WAITING SPIFR"
+                    m.next = "WAITING SPIFR"
 
             with m.State("WAITING SPIFR"):
                 with m.If(self._spifr.bus.valid):
@@ -161,7 +158,27 @@ class TestSPIFlashReader(sim.TestCase):
         while (yield dut.busy):
             yield Tick()
 
-        expected = []
-        for i in reversed(range(len(data) // 8)):
-            expected.append((yield data[i * 8 : (i + 1) * 8]))
+        expected = list((yield data).to_bytes(len(data) // 8, "big"))
+        self.assertEqual((yield from sim.fifo_content(dut._fifo_out)), expected)
+
+    @sim.args(data=C(0x0102, 16), data_width=16)
+    @sim.args(data=C(0xBEEFFEED, 32), data_width=16)
+    @sim.args(data=C(0xBEEFFEED, 32), data_width=32)
+    def test_sim_spifr_wide(
+        self, dut: TestSPIFlashReaderTop, data: Value, data_width: int
+    ) -> sim.Procedure:
+        yield dut.stb.eq(1)
+        yield Tick()
+        yield dut.stb.eq(0)
+        yield Tick()
+
+        while (yield dut.busy):
+            yield Tick()
+
+        # Bytes arrive in flash order, and are packed little-endian into beats.
+        content = (yield data).to_bytes(len(data) // 8, "big")
+        expected = [
+            int.from_bytes(content[i : i + data_width // 8], "little")
+            for i in range(0, len(content), data_width // 8)
+        ]
         self.assertEqual((yield from sim.fifo_content(dut._fifo_out)), expected)
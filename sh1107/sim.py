@@ -85,6 +85,7 @@ class TestCase(unittest.TestCase):
         pattern = re.compile(r"[\W_]+")
 
         platform = Platform["test"]
+        platformp = inspect.signature(dutc).parameters.get("platform")
 
         def sim_args_into_str(sim_args: SimArgs) -> str:
             subbed = pattern.sub("_", "_".join(str(v) for v in sim_args))
@@ -100,8 +101,6 @@ class TestCase(unittest.TestCase):
             else:
                 target = name
 
-            dutc_sig = inspect.signature(dutc)
-            platformp = dutc_sig.parameters.get("platform")
             if platformp is not None:
                 assert platformp.annotation is Platform
                 sim_args[1]["platform"] = platform
@@ -116,9 +115,8 @@ class TestCase(unittest.TestCase):
 
                 def bench() -> Procedure:
                     sim_test_kwargs = {}
-                    sim_test_sig = inspect.signature(sim_test)
                     for arg_name, arg_value in dutc_kwargs.items():
-                        if arg_name in sim_test_sig.parameters:
+                        if arg_name in sig.parameters:
                             sim_test_kwargs[arg_name] = arg_value
                     yield from sim_test(self, dut, **sim_test_kwargs)
 
@@ -198,11 +196,12 @@ def always_args(*args: Any, **kwargs: Any):
 def fifo_content(fifo: SyncFIFO) -> Generator[list[int]]:
     content: list[int] = []
 
+    # Holding r_en reads a word per cycle; the next word (or ~r_rdy) is visible
+    # right after the tick.
+    yield fifo.r_en.eq(1)
     while (yield fifo.r_rdy):
         content.append((yield fifo.r_data))
-        yield fifo.r_en.eq(1)
-        yield Tick()
-        yield fifo.r_en.eq(0)
         yield Tick()
+    yield fifo.r_en.eq(0)
 
     return content
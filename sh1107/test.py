@@ -1,7 +1,10 @@
 import sys
+import time
 from argparse import ArgumentParser, Namespace
+from multiprocessing import Pool
 from pathlib import Path
-from unittest import TestLoader, TextTestRunner
+from typing import cast
+from unittest import TestCase, TestLoader, TestResult, TestSuite, TextTestRunner
 
 __all__ = ["add_main_arguments"]
 
@@ -13,6 +16,13 @@ def add_main_arguments(parser: ArgumentParser):
         nargs="?",
         help="run tests from a specific subpackage",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="run this many tests at once in worker processes (default: 1, serially)",
+    )
 
 
 def main(args: Namespace):
@@ -20,5 +30,68 @@ def main(args: Namespace):
     if args.subpkg:
         package += f".{args.subpkg}"
     suite = TestLoader().discover(package, top_level_dir=Path(__file__).parent.parent)
-    result = TextTestRunner(verbosity=2).run(suite)
-    sys.exit(not result.wasSuccessful())
+
+    if args.jobs <= 1:
+        result = TextTestRunner(verbosity=2).run(suite)
+        sys.exit(not result.wasSuccessful())
+
+    sys.exit(not _run_parallel(suite, args.jobs))
+
+
+def _flatten(suite: TestSuite) -> list[TestCase]:
+    tests: list[TestCase] = []
+    for test in suite:
+        if isinstance(test, TestSuite):
+            tests += _flatten(test)
+        else:
+            tests.append(cast(TestCase, test))
+    return tests
+
+
+def _run_one(test: TestCase) -> tuple[str, list[str], bool]:
+    # Each simulation is independent (its own Simulator and VCD path), so it's
+    # safe to run each in its own worker and just report back as text, in the
+    # same shape TextTestRunner(verbosity=2) prints.
+    result = TestResult()
+    test.run(result)
+
+    if result.errors:
+        status = "ERROR"
+    elif result.failures:
+        status = "FAIL"
+    elif result.skipped:
+        status = f"skipped {result.skipped[0][1]!r}"
+    elif result.expectedFailures:
+        status = "expected failure"
+    elif result.unexpectedSuccesses:
+        status = "unexpected success"
+    else:
+        status = "ok"
+
+    reports = [
+        f"{flavour}: {failed}\n{'-' * 70}\n{err}"
+        for flavour, errors in (("ERROR", result.errors), ("FAIL", result.failures))
+        for failed, err in errors
+    ]
+    return f"{test} ... {status}\n", reports, result.wasSuccessful()
+
+
+def _run_parallel(suite: TestSuite, jobs: int) -> bool:
+    tests = _flatten(suite)
+
+    start = time.perf_counter()
+    all_reports: list[str] = []
+    successful = True
+    with Pool(jobs) as pool:
+        for output, reports, ok in pool.imap_unordered(_run_one, tests):
+            sys.stderr.write(output)
+            sys.stderr.flush()
+            all_reports += reports
+            successful = successful and ok
+    elapsed = time.perf_counter() - start
+
+    for report in all_reports:
+        sys.stderr.write(f"\n{'=' * 70}\n{report}")
+    sys.stderr.write(f"\n{'-' * 70}\nRan {len(tests)} tests in {elapsed:.3f}s\n\n")
+    sys.stderr.write("OK\n" if successful else "FAILED\n")
+    return successful
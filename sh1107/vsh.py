@@ -1,3 +1,4 @@
+import hashlib
 import os
 import platform as pyplatform
 import subprocess
@@ -132,8 +133,9 @@ def main(args: Namespace):
     else:
         cc_o_paths[path("vsh/spifr_whitebox.cc")] = path("build/spifr_whitebox.o")
 
-    for cc_path, o_path in cc_o_paths.items():
-        subprocess.run(
+    # The TUs are independent once sh1107.h exists, so compile them all at once.
+    procs = [
+        subprocess.Popen(
             [
                 "zig",
                 "c++",
@@ -147,8 +149,14 @@ def main(args: Namespace):
                 "-o",
                 o_path,
             ],
-            check=True,
         )
+        for cc_path, o_path in cc_o_paths.items()
+    ]
+    for proc in procs:
+        proc.wait()
+    for proc in procs:
+        if proc.returncode:
+            raise subprocess.CalledProcessError(proc.returncode, proc.args)
 
     with open(path("vsh/src/rom.bin"), "wb") as f:
         f.write(rom.ROM_CONTENT)
@@ -191,4 +199,20 @@ def _cxxrtl_convert_with_header(
         script.append(f"read_rtlil <<rtlil\n{box_source}\nrtlil")
     script.append(f"read_rtlil <<rtlil\n{rtlil_text}\nrtlil")
     script.append(f"write_cxxrtl -header {cc_out}")
-    yosys.run(["-q", "-"], "\n".join(script))
+    script_text = "\n".join(script)
+
+    # write_cxxrtl is the slow part of a rebuild, and its output only depends
+    # on the script (which embeds the design and black boxes) and the yosys
+    # that runs it.
+    digest = hashlib.sha256(f"{yosys.version()}\n{script_text}".encode()).hexdigest()
+    digest_path = cc_out.with_suffix(".sha256")
+    if (
+        cc_out.exists()
+        and cc_out.with_suffix(".h").exists()
+        and digest_path.exists()
+        and digest_path.read_text() == digest
+    ):
+        return
+
+    yosys.run(["-q", "-"], script_text)
+    digest_path.write_text(digest)
@@ -14,7 +14,7 @@ namespace cxxrtl_design {
 struct bb_p_spifr_impl : public bb_p_spifr {
   // Similar to bb_p_i2c_impl::TICKS_TO_WAIT, but between each cycle with valid
   // data.
-  const uint8_t COUNTDOWN_BETWEEN_BYTES = 2u;
+  const uint8_t COUNTDOWN_BETWEEN_BEATS = 2u;
 
   enum {
     STATE_IDLE,
@@ -32,7 +32,7 @@ struct bb_p_spifr_impl : public bb_p_spifr {
     this->countdown = 0u;
 
     p_busy = wire<1>{0u};
-    p_data = wire<8>{0u};
+    p_data = wire<16>{0u};
     p_valid = wire<1>{0u};
   }
 
@@ -53,7 +53,7 @@ struct bb_p_spifr_impl : public bb_p_spifr {
               this->address < spi_flash_base + spi_flash_length) {
             p_busy.next = value<1>{1u};
             this->state = STATE_READ;
-            this->countdown = COUNTDOWN_BETWEEN_BYTES;
+            this->countdown = COUNTDOWN_BETWEEN_BEATS;
           }
         }
         break;
@@ -64,15 +64,14 @@ struct bb_p_spifr_impl : public bb_p_spifr {
             p_busy.next = value<1>{0u};
             this->state = STATE_IDLE;
           } else {
-            this->countdown = COUNTDOWN_BETWEEN_BYTES;
-            if (this->address - spi_flash_base < spi_flash_length)
-              p_data.next =
-                  value<8>{spi_flash_content[this->address - spi_flash_base]};
-            else
-              p_data.next = value<8>{0xffu};
+            this->countdown = COUNTDOWN_BETWEEN_BEATS;
+            // Each beat is a 16-bit little-endian word.
+            p_data.next = value<16>{(uint32_t)(read_byte(this->address) |
+                                               (read_byte(this->address + 1u)
+                                                << 8u))};
             p_valid.next = value<1>{1u};
 
-            ++this->address;
+            this->address += 2u;
             --this->remaining;
           }
         }
@@ -83,6 +82,12 @@ struct bb_p_spifr_impl : public bb_p_spifr {
 
     return converged;
   }
+
+  uint8_t read_byte(uint32_t address) {
+    if (address - spi_flash_base < spi_flash_length)
+      return spi_flash_content[address - spi_flash_base];
+    return 0xffu;
+  }
 };
 
 std::unique_ptr<bb_p_spifr> bb_p_spifr::create(std::string name,